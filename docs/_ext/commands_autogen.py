@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib
+import importlib.util
 import inspect
-import pkgutil
+import os
+import pickle
 from collections import defaultdict, OrderedDict
 from pathlib import Path
-from typing import Iterable, Tuple, List
+from typing import Iterable, Iterator, Optional, Tuple, List, Union
 
 # Paths
 DOCS_DIR = Path(__file__).resolve().parents[1]
 GEN_DIR = DOCS_DIR / "commands"
 GEN_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR = DOCS_DIR / "_build" / ".paxy_autogen"
+MANIFEST_PATH = CACHE_DIR / "commands_autogen.manifest.pkl"
+# Bump when the collected data or its order changes
+_MANIFEST_FORMAT = b"2\n"
+
+# (name, category, summary, details)
+CommandInfo = Tuple[str, str, str, str]
 
 
 # -------------------------
@@ -18,32 +29,53 @@ GEN_DIR.mkdir(parents=True, exist_ok=True)
 # -------------------------
 
 
+def _iter_py_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    """
+    Recursively yield .py file entries under root (sorted, no imports).
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name != "__pycache__":
+                yield from _iter_py_files(Path(entry.path))
+        elif entry.name.endswith(".py"):
+            yield entry
+
+
+def _iter_command_module_names(root: Path) -> Iterator[str]:
+    """
+    Yield dotted names of leaf modules under paxy/commands, skipping
+    __init__/dunder files and the base module.
+    """
+    for entry in _iter_py_files(root):
+        if entry.name.startswith("__") or entry.name == "base.py":
+            continue
+        rel = Path(entry.path).relative_to(root).with_suffix("")
+        yield ".".join(("paxy", "commands", *rel.parts))
+
+
 def _iter_command_classes() -> Iterable[Tuple[str, type]]:
     """
     Yield (module_name, classobj) for Command-like classes in paxy.commands.*,
     skipping base module and re-exports.
     """
-    try:
-        import paxy.commands as root  # type: ignore
-    except Exception:
-        return []
+    root = _commands_source_root()
+    if root is None:
+        return
 
     seen: set[str] = set()
 
-    for modinfo in pkgutil.walk_packages(root.__path__, root.__name__ + "."):
-        mod_name = modinfo.name
-        tail = mod_name.rsplit(".", 1)[-1]
-        if tail.startswith("__"):
-            continue
-        if mod_name == "paxy.commands.base":
-            continue
-
-        try:
-            mod = importlib.import_module(mod_name)
-        except Exception:
-            continue
+    # Serial imports: only ~20 modules, and warm builds skip them entirely
+    # through the manifest. A broken command module fails the build loudly.
+    for mod_name in _iter_command_module_names(root):
+        mod = importlib.import_module(mod_name)
 
-        for _, obj in inspect.getmembers(mod, inspect.isclass):
+        # Name-sorted, as inspect.getmembers returned them: this order sets
+        # the index toctree (and so the docs' sidebar and prev/next links).
+        for _, obj in sorted(vars(mod).items(), key=lambda kv: kv[0]):
+            if not isinstance(obj, type):
+                continue
             if obj.__module__ != mod.__name__:
                 continue
             if not obj.__module__.startswith("paxy.commands."):
@@ -80,7 +112,8 @@ def _split_docstring(cls: type) -> tuple[str, str]:
       - summary = first non-empty line (or default)
       - details = remaining lines, skipping a single blank separator
     """
-    doc = (inspect.getdoc(cls) or "").strip()
+    # cleandoc on the class's own __doc__: getdoc's MRO fallback isn't wanted here
+    doc = inspect.cleandoc(cls.__doc__ or "").strip()
     if not doc:
         return "_No documentation_", ""
     lines = doc.splitlines()
@@ -97,27 +130,130 @@ def _split_docstring(cls: type) -> tuple[str, str]:
 # -------------------------
 
 
-def _write_command_page(name: str, category: str, summary: str, details: str) -> str:
-    """
-    Write docs/commands/<slug>.md and return slug.
+class _SlugTable(dict[int, str]):
+    """str.translate table: alphanumerics -> lowercase, anything else -> '-'.
+
+    Entries are filled lazily (and cached) so any code point is handled.
     """
-    slug = "".join(ch.lower() if ch.isalnum() else "-" for ch in str(name)).strip("-")
-    out_path = GEN_DIR / f"{slug}.md"
 
-    parts: List[str] = [
-        f"# {name}",
-        "",
-        f"**Category:** `{category}`",
-        "",
-        summary,
-        "",
-        "---",
-        "",
-        details if details else "_No detailed documentation yet._",
-        "",
+    def __missing__(self, codepoint: int) -> str:
+        ch = chr(codepoint)
+        out = ch.lower() if ch.isalnum() else "-"
+        self[codepoint] = out
+        return out
+
+
+_SLUG_TABLE = _SlugTable()
+
+
+def _command_slug(name: str) -> str:
+    return str(name).translate(_SLUG_TABLE).strip("-")
+
+
+# Fixed page fragments, encoded once
+_PAGE_TITLE = b"# "
+_PAGE_SEP = b"\n\n---\n\n"
+_PAGE_END = b"\n"
+_NO_DETAILS = "_No detailed documentation yet._".encode("utf-8")
+_PAGE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# category -> encoded "\n\n**Category:** `<category>`\n\n" fragment
+_CAT_BYTES: dict[str, bytes] = {}
+
+
+def _category_bytes(category: str) -> bytes:
+    cached = _CAT_BYTES.get(category)
+    if cached is None:
+        cached = _CAT_BYTES[category] = f"\n\n**Category:** `{category}`\n\n".encode(
+            "utf-8"
+        )
+    return cached
+
+
+# (slug, iovec of page chunks)
+RenderedPage = Tuple[str, List[bytes]]
+
+
+def _render_command_page(
+    name: str, category: str, summary: str, details: str
+) -> RenderedPage:
+    """
+    Build docs/commands/<slug>.md contents as UTF-8 chunks; return (slug, chunks).
+    """
+    slug = _command_slug(name)
+    chunks: List[bytes] = [
+        _PAGE_TITLE,
+        name.encode("utf-8"),
+        _category_bytes(category),
+        summary.encode("utf-8"),
+        _PAGE_SEP,
+        details.encode("utf-8") if details else _NO_DETAILS,
+        _PAGE_END,
     ]
-    out_path.write_text("\n".join(parts), encoding="utf-8")
-    return slug
+    return slug, chunks
+
+
+def _same_content(
+    path: Union[str, Path], chunks: List[bytes], dir_fd: Optional[int] = None
+) -> bool:
+    """
+    True if the file at path already holds exactly b"".join(chunks).
+    A size mismatch (from one fstat) answers without reading the file.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0), dir_fd=dir_fd)
+    except OSError:
+        return False
+    try:
+        size = sum(map(len, chunks))
+        if os.fstat(fd).st_size != size:
+            return False
+        return os.read(fd, size) == b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_chunks(
+    path: Union[str, Path], chunks: List[bytes], dir_fd: Optional[int] = None
+) -> None:
+    """
+    Write chunks to path, leaving the file (and its mtime) alone when the
+    content is unchanged so Sphinx does not re-read it.
+    """
+    if _same_content(path, chunks, dir_fd=dir_fd):
+        return
+    fd = os.open(path, _PAGE_FLAGS, 0o644, dir_fd=dir_fd)
+    try:
+        if hasattr(os, "writev"):
+            written = os.writev(fd, chunks)
+        else:
+            written = 0
+        # writev may be short (or unavailable); finish with plain writes
+        rest = memoryview(b"".join(chunks))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest) :]
+    finally:
+        os.close(fd)
+
+
+def _write_command_pages(pages: Iterable[RenderedPage]) -> None:
+    """
+    Write all rendered pages in one pass: one open/writev/close per changed page.
+
+    Where supported, pages are opened relative to a single descriptor for
+    docs/commands so the directory path is resolved once, not per page.
+    """
+    if os.open not in os.supports_dir_fd:
+        for slug, chunks in pages:
+            _write_chunks(GEN_DIR / f"{slug}.md", chunks)
+        return
+
+    dir_fd = os.open(GEN_DIR, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for slug, chunks in pages:
+            _write_chunks(f"{slug}.md", chunks, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
 def _generate_commands_index(pages: Iterable[Tuple[str, str, str]]) -> None:
@@ -156,7 +292,69 @@ def _generate_commands_index(pages: Iterable[Tuple[str, str, str]]) -> None:
         "",
     ]
 
-    (DOCS_DIR / "commands.md").write_text("\n".join(lines), encoding="utf-8")
+    _write_chunks(DOCS_DIR / "commands.md", ["\n".join(lines).encode("utf-8")])
+
+
+# -------------------------
+# Incremental manifest
+# -------------------------
+
+
+def _commands_source_root() -> Optional[Path]:
+    """
+    Locate paxy/commands on disk without importing its submodules.
+    """
+    try:
+        spec = importlib.util.find_spec("paxy.commands")
+    except Exception:
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return Path(list(spec.submodule_search_locations)[0])
+
+
+def _iter_source_stats(root: Path) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield (path, mtime_ns, size) for every .py file under root.
+    """
+    for entry in _iter_py_files(root):
+        st = entry.stat()
+        yield entry.path, st.st_mtime_ns, st.st_size
+
+
+def _sources_fingerprint() -> Optional[str]:
+    """
+    Cheap, stat-only fingerprint of paxy/commands (no imports).
+    """
+    root = _commands_source_root()
+    if root is None:
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_MANIFEST_FORMAT)  # manifests from an older layout/order miss
+    for path, mtime_ns, size in _iter_source_stats(root):
+        h.update(f"{path}\0{mtime_ns}\0{size}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_manifest(fingerprint: str) -> Optional[list[CommandInfo]]:
+    try:
+        with MANIFEST_PATH.open("rb") as fp:
+            manifest = pickle.load(fp)
+    except Exception:
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    cached = manifest.get(fingerprint)
+    return list(cached) if cached is not None else None
+
+
+def _store_manifest(fingerprint: str, collected: list[CommandInfo]) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with MANIFEST_PATH.open("wb") as fp:
+            pickle.dump({fingerprint: collected}, fp)
+    except OSError:
+        pass  # the cache is an optimisation only
 
 
 # -------------------------
@@ -164,24 +362,46 @@ def _generate_commands_index(pages: Iterable[Tuple[str, str, str]]) -> None:
 # -------------------------
 
 
-def _generate_all_commands(_app=None) -> None:
+@functools.lru_cache(maxsize=None)
+def _collect_commands(fingerprint: Optional[str]) -> tuple[CommandInfo, ...]:
     """
-    Generate per-command pages + grouped index.
+    Import paxy.commands.* and return (name, category, summary, details) per command.
+
+    Memoized on the source fingerprint, so repeated builder-inited events in
+    one process reuse the result until paxy/commands changes on disk.
     """
-    collected: list[
-        tuple[str, str, str, str]
-    ] = []  # (name, category, summary, details)
+    collected: list[CommandInfo] = []
     for _, cls in _iter_command_classes():
         name = getattr(cls, "COMMAND", cls.__name__)
         category = _get_category(cls)
         summary, details = _split_docstring(cls)
         collected.append((name, category, summary, details))
+    return tuple(collected)
+
 
-    # Write per-command pages and index
+def _generate_all_commands(_app=None) -> None:
+    """
+    Generate per-command pages + grouped index.
+
+    When paxy/commands is unchanged since the last build (same paths, mtimes
+    and sizes), the cached manifest is reused and no command module is imported.
+    """
+    fingerprint = _sources_fingerprint()
+    collected = _load_manifest(fingerprint) if fingerprint else None
+    if collected is None:
+        collected = list(_collect_commands(fingerprint))
+        if fingerprint:
+            _store_manifest(fingerprint, collected)
+
+    # Render per-command pages, then write them (and the index) in one batch;
+    # pages whose content is unchanged are not rewritten.
     pages: list[Tuple[str, str, str]] = []
+    rendered: list[RenderedPage] = []
     for name, category, summary, details in collected:
-        slug = _write_command_page(name, category, summary, details)
+        slug, chunks = _render_command_page(name, category, summary, details)
+        rendered.append((slug, chunks))
         pages.append((slug, name, category))
+    _write_command_pages(rendered)
     _generate_commands_index(pages)
 
 
@@ -1,5 +1,7 @@
 # docs/_ext/paxy_lexer.py
-from pygments.lexer import RegexLexer
+import re
+
+from pygments.lexer import Lexer
 from pygments.token import (
     Text,
     Comment,
@@ -14,53 +16,67 @@ from pygments.token import (
 
 COMMANDS = r"(LET|PNT|INP|IF|GO|LBL|SUB|SBE|RET|GOS|RNG|RNE|PAR|INC|DEC|MAP|MAD|MAL|ROW|VEC|IGL|ISBOP|INOP|CMP|IMP)"
 
+# One combined pattern shared by both states. Alternatives are tried in order,
+# exactly like the rule list of a RegexLexer, so the first match still wins.
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<comment>\#.*?$)
+    | (?P<ws>\s+)
+    | (?P<str>"([^"\\]|\\.)*")
+    | (?P<flt>\b\d+\.\d+\b)
+    | (?P<int>\b\d+\b)
+    | (?P<punct>[\[\]\(\),])
+    | (?P<op>\*\*|//|<<|>>|==|!=|<=|>=|is\ not|not\ in|in|is|[+\-*/%&|^<>])
+    | (?P<cmd>^[A-Z]+\b)
+    | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+    | (?P<text>.)
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# Keywords are checked by set membership instead of a regex alternation
+_CMD_SET = frozenset(COMMANDS.strip("()").split("|"))
 
-class PaxyLexer(RegexLexer):
+_GROUP_TOKENS = {
+    "comment": Comment.Single,
+    "ws": Whitespace,
+    "str": String.Double,
+    "flt": Number.Float,
+    "int": Number.Integer,
+    "punct": Punctuation,
+    "op": Operator.Word,
+    "cmd": Keyword,
+    "name": Name,
+    "text": Text,
+}
+
+
+class PaxyLexer(Lexer):
     """
     Very small lexer for Paxy examples:
     - Treats leading words like LET/PNT/etc. as keywords
     - Supports # comments to end of line
     - Numbers, strings, names, common operators
+
+    After a command keyword the lexer is "inside a line" (no further keywords)
+    until the next comment, as with the original two-state rule table.
     """
 
     name = "Paxy"
     aliases = ["paxy", "basic"]  # accept both tags
     filenames = []
 
-    tokens = {
-        "root": [
-            (r"#.*?$", Comment.Single),
-            (r"\s+", Whitespace),
-            # strings: "..."
-            (r'"([^"\\]|\\.)*"', String.Double),
-            # numbers: ints and floats
-            (r"\b\d+\.\d+\b", Number.Float),
-            (r"\b\d+\b", Number.Integer),
-            # punctuation (brackets, commas)
-            (r"[\[\]\(\),]", Punctuation),
-            # operators
-            (
-                r"(\*\*|//|<<|>>|==|!=|<=|>=|is not|not in|in|is|[+\-*/%&|^<>])",
-                Operator.Word,
-            ),
-            # command keyword at start of line
-            (rf"^{COMMANDS}\b", Keyword, "rest_of_line"),
-            # otherwise treat bare names
-            (r"[A-Za-z_][A-Za-z_0-9]*", Name),
-            (r".", Text),
-        ],
-        "rest_of_line": [
-            (r"\s+", Whitespace),
-            (r"#.*?$", Comment.Single, "#pop"),
-            (r'"([^"\\]|\\.)*"', String.Double),
-            (r"\b\d+\.\d+\b", Number.Float),
-            (r"\b\d+\b", Number.Integer),
-            (r"[\[\]\(\),]", Punctuation),
-            (
-                r"(\*\*|//|<<|>>|==|!=|<=|>=|is not|not in|in|is|[+\-*/%&|^<>])",
-                Operator.Word,
-            ),
-            (r"[A-Za-z_][A-Za-z_0-9]*", Name),
-            (r".", Text),
-        ],
-    }
+    def get_tokens_unprocessed(self, text):
+        in_line = False
+        for m in _TOKEN_RE.finditer(text):
+            group = m.lastgroup
+            if group == "cmd":
+                word = m.group()
+                if in_line or word not in _CMD_SET:
+                    # unknown words, or command words mid-line, are plain names
+                    yield m.start(), Name, word
+                    continue
+                in_line = True
+            elif group == "comment":
+                in_line = False
+            yield m.start(), _GROUP_TOKENS[group], m.group()
@@ -4,12 +4,14 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
-from paxy.compiler.compile import PaxyCompiler
+from paxy.compiler.compile import PaxyCompiler, compile_files
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     ap = argparse.ArgumentParser(prog="paxy")
-    ap.add_argument("source", help="Path to .paxy program")
+    ap.add_argument(
+        "source", nargs="+", help="Path to .paxy program (several with --compile-only)"
+    )
     ap.add_argument(
         "--compile-only", action="store_true", help="Only compile to .pyc, do not run"
     )
@@ -29,7 +31,20 @@ def main(argv: Optional[list[str]] = None) -> int:
     )
     args = ap.parse_args(argv)
 
-    c = PaxyCompiler(Path(args.source), verbose=args.verbose, no_cache=args.no_cache)
+    if len(args.source) > 1:
+        if not args.compile_only:
+            ap.error("several sources can only be given with --compile-only")
+        outs = compile_files(
+            args.source,
+            hash_based=args.hash_based,
+            optimization=args.optlevel,
+            no_cache=args.no_cache,
+        )
+        if args.verbose:
+            print(*outs, sep="\n")
+        return 0
+
+    c = PaxyCompiler(Path(args.source[0]), verbose=args.verbose, no_cache=args.no_cache)
 
     if args.compile_only:
         out = c.compile_pyc(hash_based=args.hash_based, optimization=args.optlevel)
@@ -1,19 +1,21 @@
 # paxy/basic/__init__.py
 
-from dis import opmap
+from opcode import opmap
 from typing import Any
 
 from paxy.commands.base import BasicItem
-from paxy.commands.core import CORE_COMMANDS
+from paxy.commands.core import CORE_COMMAND_PATHS, load_command
+from paxy.compiler.ir import ParsedItem
 
-BLOCK_OPS = {"SUB", "SBE", "RNG", "RNE"}
+BLOCK_OPS = frozenset({"SUB", "SBE", "RNG", "RNE"})
 
 
 def is_command(op_name: str) -> bool:
-    return op_name in CORE_COMMANDS
+    return op_name in CORE_COMMAND_PATHS
 
 
-VALID_COMMANDS = set(opmap) | set(CORE_COMMANDS) | BLOCK_OPS
+# Fixed at import; every line's first NAME token is checked against it.
+VALID_COMMANDS = frozenset(opmap).union(CORE_COMMAND_PATHS, BLOCK_OPS)
 
 
 def is_command_name(op_name: str) -> bool:
@@ -21,6 +23,13 @@ def is_command_name(op_name: str) -> bool:
 
 
 def command(op_name: str, op_args: list[Any], lineno: int) -> list[BasicItem]:
-    cls = CORE_COMMANDS[op_name]
-    inst = cls(op_args, lineno)
-    return inst.ops
+    ops: list[BasicItem] = []
+    load_command(op_name)(op_args, lineno, ops)
+    return ops
+
+
+def emit_command(
+    op_name: str, op_args: list[Any], lineno: int, sink: list[ParsedItem]
+) -> None:
+    """Like command(), but append the lowered items straight onto sink."""
+    load_command(op_name)(op_args, lineno, sink)
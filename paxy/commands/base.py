@@ -1,14 +1,39 @@
 # paxy/basic/base.py
 
-from typing import Any, TypeAlias, Union
+from typing import Any, Iterable, Optional, TypeAlias, Union
 
 from bytecode import BinaryOp, Instr
+from bytecode.instr import UNSET
 
-from paxy.compiler.ir import Ident, JumpRef, LabelDecl, NamedJump, ReturnMarker
+from paxy.compiler.fastinstr import new_instr
+from paxy.compiler.ir import (
+    Ident,
+    JumpRef,
+    LabelDecl,
+    NamedJump,
+    ParsedItem,
+    ReturnMarker,
+    plain_name,
+)
 from paxy.compiler.opcoerce import BINARY_SYMBOL_MAP, coerce_binary_op
 
 _NOARG = object()
 
+# Ops whose str arg is a name: interned on emission, so repeated identifiers
+# share one str and later set/dict probes compare by identity.
+_NAME_OPS = frozenset({"LOAD_NAME", "STORE_NAME", "DELETE_NAME", "LOAD_GLOBAL"})
+
+
+# Operand type -> opcode that loads it; types are added on first sight, so
+# loads cost one dict probe instead of an isinstance check per operand.
+_LOAD_OPS: dict[type, str] = {Ident: "LOAD_NAME"}
+
+
+def _load_op_for(tp: type) -> str:
+    op = "LOAD_NAME" if issubclass(tp, Ident) else "LOAD_CONST"
+    _LOAD_OPS[tp] = op
+    return op
+
 
 # What BASIC ops may emit
 BasicItem = Union[Instr, LabelDecl, JumpRef, NamedJump, ReturnMarker]
@@ -18,8 +43,18 @@ class Command:
     COMMAND = "COMMAND"
     SUMMARY = "Base command, override and add description in subclass."
 
-    def __init__(self, op_args: list[Any], lineno: int) -> None:
-        self.ops: list[BasicItem] = []
+    def __init__(
+        self,
+        op_args: list[Any],
+        lineno: int,
+        ops: Optional[Union[list[BasicItem], list[ParsedItem]]] = None,
+    ) -> None:
+        # ops may be the caller's own stream: the parser passes its sink so
+        # emitted items land in place, with no per-statement list to extend.
+        # That is also why it is never preallocated as [None] * n: ops is
+        # usually the whole program's stream, and fixed shapes already go in
+        # as one literal list (ops += [...]).
+        self.ops: Union[list[BasicItem], list[ParsedItem]] = [] if ops is None else ops
         self.lineno: int = lineno
         self.make_ops(op_args)
 
@@ -30,21 +65,38 @@ class Command:
         return arg
 
     def add_op(self, op_name: str, op_arg: Any = _NOARG) -> None:
+        # Always a fresh Instr: copying a shared prototype and setting lineno
+        # measured slower than constructing, and the assembler and 3.12
+        # fixups mutate emitted Instrs in place, so they must not be shared.
         if op_arg is _NOARG:
-            op = Instr(op_name, lineno=self.lineno)
-        else:
-            coerced = coerce_binary_op(op_arg) if op_name == "BINARY_OP" else op_arg
-            op = Instr(op_name, coerced, lineno=self.lineno)
-        self.ops.append(op)
+            op_arg = UNSET
+        elif op_name == "BINARY_OP":
+            op_arg = coerce_binary_op(op_arg)
+        elif op_name in _NAME_OPS and isinstance(op_arg, str):
+            op_arg = plain_name(op_arg)
+        self.ops.append(new_instr(op_name, op_arg, lineno=self.lineno))
 
     def make_ops(self, op_args: list[Any]) -> None:
+        # Subclasses check arity inline (len(op_args) != N): a shared
+        # _require(args, arities) helper measured about 2x slower per call,
+        # and `not in (2, 3)` is already a constant tuple, built at compile time.
         raise NotImplementedError
 
+    def _load_instr(self, value: Any) -> Instr:
+        tp = type(value)
+        op = _LOAD_OPS.get(tp) or _load_op_for(tp)
+        # loads never need add_op's BINARY_OP coercion, so build directly
+        if op == "LOAD_NAME":
+            value = plain_name(value)
+        return new_instr(op, value, lineno=self.lineno)
+
     def _emit_load_for(self, value: Any) -> None:
-        if isinstance(value, Ident):
-            self.add_op("LOAD_NAME", str(value))
-        else:
-            self.add_op("LOAD_CONST", value)
+        self.ops.append(self._load_instr(value))
+
+    def _emit_loads(self, values: Iterable[Any]) -> None:
+        """Emit one load per value; a single extend for element lists."""
+        load = self._load_instr
+        self.ops.extend([load(v) for v in values])
 
 
 CommandMap: TypeAlias = dict[str, type[Command]]
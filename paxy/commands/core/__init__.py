@@ -1,63 +1,62 @@
-from paxy.commands.base import CommandMap
-from paxy.commands.core.compare import Compare
-from paxy.commands.core.convert import ToFloat, ToInt, ToStr
-from paxy.commands.core.dec import Dec
-from paxy.commands.core.gosub import Gosub
-from paxy.commands.core.ifjump import IfOp
-from paxy.commands.core.igl import Igloo
-from paxy.commands.core.importer import ImportSimple
-from paxy.commands.core.inc import Inc
-from paxy.commands.core.inop import InCommand, NotInCommand
-from paxy.commands.core.inp import Input
-from paxy.commands.core.isbop import IsCommand, IsNotCommand
-from paxy.commands.core.label import GotoCommand, LabelCommand
-from paxy.commands.core.let import Let
-from paxy.commands.core.mad import Mad
-from paxy.commands.core.map import MapCommand
-from paxy.commands.core.mapdel import MapDel
-from paxy.commands.core.par import Par
-from paxy.commands.core.pnt import Print
-from paxy.commands.core.returnstmt import ReturnCommand
-from paxy.commands.core.row import RowCommand
-from paxy.commands.core.vec import (
-    LenCommand,
-    VAppendCommand,
-    VecCommand,
-    VPopCommand,
-    VRemoveCommand,
-    VReverseCommand,
-)
-
-CORE_COMMANDS: CommandMap = {
-    "PNT": Print,
-    "LET": Let,
-    "INP": Input,
-    "IMP": ImportSimple,
-    "GOS": Gosub,
-    "LBL": LabelCommand,
-    "GO": GotoCommand,
-    "DEC": Dec,
-    "CMP": Compare,
-    "IS": IsCommand,
-    "NIS": IsNotCommand,
-    "IN": InCommand,
-    "NIN": NotInCommand,
-    "INC": Inc,
-    "IF": IfOp,
-    "ROW": RowCommand,
-    "IGL": Igloo,
-    "VEC": VecCommand,
-    "MAP": MapCommand,
-    "MAD": Mad,
-    "MAL": MapDel,
-    "RET": ReturnCommand,
-    "PAR": Par,
-    "TIN": ToInt,
-    "TFL": ToFloat,
-    "TST": ToStr,
-    "VAP": VAppendCommand,
-    "VOP": VPopCommand,
-    "VEM": VRemoveCommand,
-    "VER": VReverseCommand,
-    "LEN": LenCommand,
+"""Core command table.
+
+Command modules are imported lazily: a program only pays for the commands it
+actually uses. ``CORE_COMMANDS`` is still available as a full name -> class
+mapping, built (importing every command module) on first access.
+"""
+
+import importlib
+from functools import cache
+
+from paxy.commands.base import Command, CommandMap
+
+# command name -> "<module under paxy.commands.core>:<Command subclass>"
+CORE_COMMAND_PATHS: dict[str, str] = {
+    "PNT": "pnt:Print",
+    "LET": "let:Let",
+    "INP": "inp:Input",
+    "IMP": "importer:ImportSimple",
+    "GOS": "gosub:Gosub",
+    "LBL": "label:LabelCommand",
+    "GO": "label:GotoCommand",
+    "DEC": "dec:Dec",
+    "CMP": "compare:Compare",
+    "IS": "isbop:IsCommand",
+    "NIS": "isbop:IsNotCommand",
+    "IN": "inop:InCommand",
+    "NIN": "inop:NotInCommand",
+    "INC": "inc:Inc",
+    "IF": "ifjump:IfOp",
+    "ROW": "row:RowCommand",
+    "IGL": "igl:Igloo",
+    "VEC": "vec:VecCommand",
+    "MAP": "map:MapCommand",
+    "MAD": "mad:Mad",
+    "MAL": "mapdel:MapDel",
+    "RET": "returnstmt:ReturnCommand",
+    "PAR": "par:Par",
+    "TIN": "convert:ToInt",
+    "TFL": "convert:ToFloat",
+    "TST": "convert:ToStr",
+    "VAP": "vec:VAppendCommand",
+    "VOP": "vec:VPopCommand",
+    "VEM": "vec:VRemoveCommand",
+    "VER": "vec:VReverseCommand",
+    "LEN": "vec:LenCommand",
 }
+
+
+@cache
+def load_command(op_name: str) -> type[Command]:
+    """Import (once) and return the Command class registered for op_name."""
+    module, _, attr = CORE_COMMAND_PATHS[op_name].partition(":")
+    cls: type[Command] = getattr(importlib.import_module(f"{__name__}.{module}"), attr)
+    return cls
+
+
+def __getattr__(name: str) -> CommandMap:
+    if name == "CORE_COMMANDS":
+        table: CommandMap = {op: load_command(op) for op in CORE_COMMAND_PATHS}
+        globals()[name] = table  # later lookups skip this hook
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 from paxy.compiler.opcoerce import coerce_compare_op
 
 
@@ -18,4 +18,4 @@ class Compare(Command):
         self._emit_load_for(lhs)
         self._emit_load_for(rhs)
         self.add_op("COMPARE_OP", coerce_compare_op(cmpop))
-        self.add_op("STORE_NAME", str(dst))
+        self.add_op("STORE_NAME", plain_name(dst))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 __all__ = ["ToInt", "ToFloat", "ToStr"]
 
@@ -15,12 +15,12 @@ class _ConvertBase(Command):
         if isinstance(tok, Ident):
             # Module-level will be LOAD_NAME; your function rewriter will turn
             # these into LOAD_FAST inside SUB bodies.
-            self.add_op("LOAD_NAME", str(tok))
+            self.add_op("LOAD_NAME", plain_name(tok))
         else:
             self.add_op("LOAD_CONST", tok)
 
     def _emit_store_name(self, ident: Ident) -> None:
-        self.add_op("STORE_NAME", str(ident))
+        self.add_op("STORE_NAME", plain_name(ident))
 
     def make_ops(self, op_args: list[Any]) -> None:
         pass
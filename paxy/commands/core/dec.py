@@ -6,7 +6,7 @@ from typing import Any
 from bytecode import BinaryOp
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 
 class Dec(Command):
@@ -20,7 +20,7 @@ class Dec(Command):
         if not isinstance(name, Ident):
             raise SyntaxError("DEC expects an identifier")
 
-        ident = str(name)
+        ident = plain_name(name)
 
         self.add_op("LOAD_NAME", ident)
         self.add_op("LOAD_CONST", 1)
@@ -11,7 +11,8 @@ Rationale:
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.fastinstr import new_instr
+from paxy.compiler.ir import Ident, plain_name
 
 
 class Gosub(Command):
@@ -39,22 +40,21 @@ class Gosub(Command):
 
         # Resolve callable: accept Ident or str
         if isinstance(fn_token, Ident):
-            fn_name = str(fn_token)
+            fn_name = plain_name(fn_token)
         elif isinstance(fn_token, str):
             fn_name = fn_token
         else:
             raise SyntaxError("GOS second argument must be a subroutine name")
 
+        ln = self.lineno
         # 3.13 pattern without PRECALL: NULL comes from LOAD_GLOBAL(True, name)
-        self.add_op("LOAD_GLOBAL", (True, fn_name))
+        ops = [new_instr("LOAD_GLOBAL", (True, fn_name), lineno=ln)]
 
         # Positional args
-        for a in args:
-            if isinstance(a, Ident):
-                self.add_op("LOAD_NAME", str(a))
-            else:
-                self.add_op("LOAD_CONST", a)
+        load = self._load_instr
+        ops += [load(a) for a in args]
 
         # Direct call & store
-        self.add_op("CALL", len(args))
-        self.add_op("STORE_NAME", str(dst_ident))
+        ops.append(new_instr("CALL", len(args), lineno=ln))
+        ops.append(new_instr("STORE_NAME", plain_name(dst_ident), lineno=ln))
+        self.ops += ops
@@ -1,5 +1,6 @@
 # paxy/basic/ifjump.py
 
+import sys
 from typing import Any
 
 from paxy.commands.base import Command
@@ -28,20 +29,13 @@ class IfOp(Command):
         if not isinstance(label, Ident):
             raise SyntaxError("IF expects a label identifier as the fourth argument")
 
-        # LOAD lhs
-        if isinstance(lhs, Ident):
-            self.add_op("LOAD_NAME", str(lhs))
-        else:
-            self.add_op("LOAD_CONST", lhs)
-
-        # LOAD rhs
-        if isinstance(rhs, Ident):
-            self.add_op("LOAD_NAME", str(rhs))
-        else:
-            self.add_op("LOAD_CONST", rhs)
+        self._emit_load_for(lhs)
+        self._emit_load_for(rhs)
 
         # COMPARE_OP (supports symbols or enum names; coercer handles both)
         self.add_op("COMPARE_OP", coerce_compare_op(cmpop))
 
         # Jump if true (assembler will resolve NamedJump to real Label arg)
-        self.ops.append(NamedJump("POP_JUMP_IF_TRUE", str(label), self.lineno))
+        self.ops.append(
+            NamedJump("POP_JUMP_IF_TRUE", sys.intern(str(label)), self.lineno)
+        )
@@ -2,13 +2,14 @@
 """
 IGL <name> [elem1 elem2 ...]  -> name = frozenset({elem1, ...})
 Fast path: all literals & hashable -> LOAD_CONST frozenset(...)
-Fallback: mixed -> LOAD_NAME 'frozenset'; LOAD_*...; BUILD_TUPLE N; CALL 1
+Fallback: mixed -> LOAD_CONST frozenset(literals); BUILD_SET of the names;
+          BINARY_OP | (frozenset | set is a frozenset)
 """
 
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 
 class Igloo(Command):
@@ -120,7 +121,7 @@ class Igloo(Command):
     def make_ops(self, op_args: list[Any]) -> None:
         if not op_args or not isinstance(op_args[0], Ident):
             raise SyntaxError("IGL expects: IGL <name> [elem ...]")
-        dst_ident = str(op_args[0])
+        dst_ident = plain_name(op_args[0])
         elems = op_args[1:]
 
         # Fast path: all literals and hashable
@@ -135,11 +136,19 @@ class Igloo(Command):
                 self.add_op("STORE_NAME", dst_ident)
                 return
 
-        # Fallback: build at runtime via function call
-        # Stack order for CALL: push callable first, then arguments
-        self.add_op("LOAD_NAME", "frozenset")
-        for e in elems:
-            self._emit_load_for(e)
-        self.add_op("BUILD_TUPLE", len(elems))  # frozenset(iterable)
-        self.add_op("CALL", 1)
+        # Otherwise fold the hashable literals into one constant and union in
+        # a set of the identifiers:  dst = konst | {*idents}
+        # frozenset | set yields a frozenset, so there is no CALL: no NULL
+        # slot to get right at module level, in SUBs (where names become
+        # LOAD_GLOBAL/LOAD_FAST) or under the 3.12 PUSH_NULL normalization.
+        try:
+            konst = frozenset(e for e in elems if not isinstance(e, Ident))
+            loads = [e for e in elems if isinstance(e, Ident)]
+        except TypeError:
+            # unhashable literal (e.g., list): load everything, fail at runtime
+            konst, loads = frozenset(), elems
+        self.add_op("LOAD_CONST", konst)
+        self._emit_loads(loads)
+        self.add_op("BUILD_SET", len(loads))
+        self.add_op("BINARY_OP", "|")
         self.add_op("STORE_NAME", dst_ident)
@@ -1,6 +1,7 @@
 from typing import Any
 
 from paxy.commands.base import Command
+from paxy.compiler.fastinstr import new_instr
 
 
 class ImportSimple(Command):
@@ -18,8 +19,11 @@ class ImportSimple(Command):
         mod = op_args[0]
         if not isinstance(mod, str):
             raise SyntaxError("IMP expects a string literal module name")
-        self.add_op("LOAD_NAME", "__import__")
-        self.add_op("PUSH_NULL")
-        self.add_op("LOAD_CONST", mod)
-        self.add_op("CALL", 1)
-        self.add_op("POP_TOP")
+        ln = self.lineno
+        self.ops += [
+            new_instr("LOAD_NAME", "__import__", lineno=ln),
+            new_instr("PUSH_NULL", lineno=ln),
+            new_instr("LOAD_CONST", mod, lineno=ln),
+            new_instr("CALL", 1, lineno=ln),
+            new_instr("POP_TOP", lineno=ln),
+        ]
@@ -1,7 +1,7 @@
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 
 class InCommand(Command):
@@ -16,7 +16,7 @@ class InCommand(Command):
         self._emit_load_for(needle)
         self._emit_load_for(hay)
         self.add_op("CONTAINS_OP", 0)  # 0 -> IN
-        self.add_op("STORE_NAME", str(dst))
+        self.add_op("STORE_NAME", plain_name(dst))
 
 
 class NotInCommand(Command):
@@ -31,4 +31,4 @@ class NotInCommand(Command):
         self._emit_load_for(needle)
         self._emit_load_for(hay)
         self.add_op("CONTAINS_OP", 1)  # 1 -> NOT_IN
-        self.add_op("STORE_NAME", str(dst))
+        self.add_op("STORE_NAME", plain_name(dst))
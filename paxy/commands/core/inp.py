@@ -1,7 +1,8 @@
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.fastinstr import new_instr
+from paxy.compiler.ir import Ident, plain_name
 
 
 class Input(Command):
@@ -108,7 +109,11 @@ class Input(Command):
         name = op_args[0]
         if not isinstance(name, Ident):
             raise SyntaxError("INP expects an identifier")
-        self.add_op("LOAD_NAME", "input")
-        self.add_op("PUSH_NULL")
-        self.add_op("CALL", 0)
-        self.add_op("STORE_NAME", str(name))
+        # fixed shape, built as one literal like PNT
+        ln = self.lineno
+        self.ops += [
+            new_instr("LOAD_NAME", "input", lineno=ln),
+            new_instr("PUSH_NULL", lineno=ln),
+            new_instr("CALL", 0, lineno=ln),
+            new_instr("STORE_NAME", plain_name(name), lineno=ln),
+        ]
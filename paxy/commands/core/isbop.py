@@ -1,7 +1,7 @@
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 
 class IsCommand(Command):
@@ -16,7 +16,7 @@ class IsCommand(Command):
         self._emit_load_for(lhs)
         self._emit_load_for(rhs)
         self.add_op("IS_OP", 0)  # 0 -> IS
-        self.add_op("STORE_NAME", str(dst))
+        self.add_op("STORE_NAME", plain_name(dst))
 
 
 class IsNotCommand(Command):
@@ -31,4 +31,4 @@ class IsNotCommand(Command):
         self._emit_load_for(lhs)
         self._emit_load_for(rhs)
         self.add_op("IS_OP", 1)  # 1 -> IS_NOT
-        self.add_op("STORE_NAME", str(dst))
+        self.add_op("STORE_NAME", plain_name(dst))
@@ -1,3 +1,4 @@
+import sys
 from typing import Any
 
 from paxy.commands.base import Command
@@ -16,7 +17,7 @@ class LabelCommand(Command):
         if not isinstance(name, Ident):
             raise SyntaxError("LBL expects an identifier")
         # Emit a placeholder; assembler will replace with a real bytecode.Label
-        self.ops.append(LabelDecl(str(name), self.lineno))
+        self.ops.append(LabelDecl(sys.intern(str(name)), self.lineno))
 
 
 class GotoCommand(Command):
@@ -31,4 +32,4 @@ class GotoCommand(Command):
         if not isinstance(name, Ident):
             raise SyntaxError("GO expects an identifier")
         # Emit a placeholder; assembler picks forward/backward opcode later
-        self.ops.append(JumpRef(str(name), self.lineno))
+        self.ops.append(JumpRef(sys.intern(str(name)), self.lineno))
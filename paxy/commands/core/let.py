@@ -1,9 +1,18 @@
 # paxy/basic/let.py
 from typing import Any, Tuple
 
+from bytecode import BinaryOp
+from bytecode.instr import Compare
+
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 from paxy.compiler.opcoerce import (
+    BINARY_SYMBOL_MAP,
+    COMPARE_SYMBOL_MAP,
+    CONTAINS_SYMBOL_MAP,
+    IS_SYMBOL_MAP,
+    ContainsOp,
+    IsOp,
     coerce_binary_op,
     coerce_compare_op,
     coerce_contains_op,
@@ -11,6 +20,47 @@ from paxy.compiler.opcoerce import (
 )
 
 
+def _classify_op_text(text: str) -> Tuple[str, Any]:
+    # comparisons: == != < <= > >=
+    try:
+        return "COMPARE_OP", coerce_compare_op(text)
+    except SyntaxError:
+        pass
+
+    # identity: is / is not
+    try:
+        return "IS_OP", coerce_is_op(text)
+    except SyntaxError:
+        pass
+
+    # membership: in / not in
+    try:
+        return "CONTAINS_OP", coerce_contains_op(text)
+    except SyntaxError:
+        pass
+
+    # fall back to binary arithmetic/bitwise
+    return "BINARY_OP", coerce_binary_op(text)
+
+
+# Every operator symbol and canonical enum name, classified once at import so
+# the common case is a dict probe rather than a chain of failed coercions.
+# Only invalid operators reach the exception-driven _classify_op_text.
+_OP_TABLE: dict[str, Tuple[str, Any]] = {
+    text: _classify_op_text(text)
+    for text in (
+        *COMPARE_SYMBOL_MAP,
+        *IS_SYMBOL_MAP,
+        *CONTAINS_SYMBOL_MAP,
+        *BINARY_SYMBOL_MAP,
+        *Compare.__members__,
+        *IsOp.__members__,
+        *ContainsOp.__members__,
+        *BinaryOp.__members__,
+    )
+}
+
+
 class Let(Command):
     """Assign a value. Also supports operators: arithmetic, comparison, `is`, `in`, etc.
 
@@ -213,7 +263,7 @@ class Let(Command):
     # ---------- simple form ----------
 
     def _emit_simple_assignment(self, dst_ident: Ident, value: Any) -> None:
-        self._emit_load(value)
+        self._emit_load_for(value)
         self._emit_store(dst_ident)
 
     # ---------- operator form ----------
@@ -221,22 +271,16 @@ class Let(Command):
     def _emit_operator_assignment(
         self, dst_ident: Ident, lhs: Any, op: Any, rhs: Any
     ) -> None:
-        self._emit_load(lhs)
-        self._emit_load(rhs)
+        self._emit_load_for(lhs)
+        self._emit_load_for(rhs)
         kind, coerced = self._classify_and_coerce_op(op)
         self._emit_op(kind, coerced)
         self._emit_store(dst_ident)
 
     # ---------- tiny primitives ----------
 
-    def _emit_load(self, value: Any) -> None:
-        if isinstance(value, Ident):
-            self.add_op("LOAD_NAME", str(value))
-        else:
-            self.add_op("LOAD_CONST", value)
-
     def _emit_store(self, ident: Ident) -> None:
-        self.add_op("STORE_NAME", str(ident))
+        self.add_op("STORE_NAME", plain_name(ident))
 
     # ---------- operator classification ----------
 
@@ -246,27 +290,12 @@ class Let(Command):
         Returns (kind, coerced_arg) where kind ∈ {"COMPARE_OP","IS_OP","CONTAINS_OP","BINARY_OP"}.
         """
         text = str(op)
-
-        # comparisons: == != < <= > >=
-        try:
-            return "COMPARE_OP", coerce_compare_op(text)
-        except SyntaxError:
-            pass
-
-        # identity: is / is not
-        try:
-            return "IS_OP", coerce_is_op(text)
-        except SyntaxError:
-            pass
-
-        # membership: in / not in
-        try:
-            return "CONTAINS_OP", coerce_contains_op(text)
-        except SyntaxError:
-            pass
-
-        # fall back to binary arithmetic/bitwise
-        return "BINARY_OP", coerce_binary_op(text)
+        # Names are matched case-insensitively by the coercers, so an
+        # upper-cased retry resolves them without raising anything.
+        hit = _OP_TABLE.get(text) or _OP_TABLE.get(text.upper())
+        if hit is not None:
+            return hit
+        return _classify_op_text(text)
 
     def _emit_op(self, kind: str, coerced: Any) -> None:
         # All these opcodes take exactly one argument
@@ -1,7 +1,7 @@
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 
 class MapCommand(Command):
@@ -32,7 +32,7 @@ class MapCommand(Command):
             raise SyntaxError(
                 "MAP expects: MAP <name> [k v ...] (name must be an identifier)"
             )
-        dst_ident = str(op_args[0])
+        dst_ident = plain_name(op_args[0])
         rest = op_args[1:]
 
         if len(rest) % 2 != 0:
@@ -1,6 +1,8 @@
 from typing import Any
 
 from paxy.commands.base import Command
+from paxy.compiler.fastinstr import new_instr
+from paxy.compiler.ir import Ident, plain_name
 
 
 class Print(Command):
@@ -110,16 +112,29 @@ class Print(Command):
         if len(op_args) > 1:
             raise SyntaxError("PNT takes at most one argument")
 
-        # Load builtin print and prepare CALL convention
-        self.add_op("LOAD_NAME", "print")
-        self.add_op("PUSH_NULL")
-
+        # PNT is the most common command, so its fixed shape is built as one
+        # literal rather than through add_op per instruction.
+        ln = self.lineno
         if len(op_args) == 0:
             # print()
-            self.add_op("CALL", 0)
+            self.ops += [
+                new_instr("LOAD_NAME", "print", lineno=ln),
+                new_instr("PUSH_NULL", lineno=ln),
+                new_instr("CALL", 0, lineno=ln),
+                new_instr("POP_TOP", lineno=ln),
+            ]
+            return
+
+        # print(<arg>) — load identifier as name, literal as const
+        value = op_args[0]
+        if isinstance(value, Ident):
+            load = new_instr("LOAD_NAME", plain_name(value), lineno=ln)
         else:
-            # print(<arg>) — load identifier as name, literal as const
-            self._emit_load_for(op_args[0])
-            self.add_op("CALL", 1)
-
-        self.add_op("POP_TOP")
+            load = new_instr("LOAD_CONST", value, lineno=ln)
+        self.ops += [
+            new_instr("LOAD_NAME", "print", lineno=ln),
+            new_instr("PUSH_NULL", lineno=ln),
+            load,
+            new_instr("CALL", 1, lineno=ln),
+            new_instr("POP_TOP", lineno=ln),
+        ]
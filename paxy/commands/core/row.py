@@ -8,7 +8,7 @@ Fallback: mixed idents/literals -> LOAD_*...; BUILD_TUPLE N
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 
 class RowCommand(Command):
@@ -118,7 +118,7 @@ class RowCommand(Command):
     def make_ops(self, op_args: list[Any]) -> None:
         if not op_args or not isinstance(op_args[0], Ident):
             raise SyntaxError("ROW expects: ROW <name> [elem ...]")
-        dst_ident = str(op_args[0])
+        dst_ident = plain_name(op_args[0])
         elems = op_args[1:]
 
         # Fast path: all literals
@@ -128,7 +128,6 @@ class RowCommand(Command):
             return
 
         # Fallback: builder path
-        for e in elems:
-            self._emit_load_for(e)
+        self._emit_loads(elems)
         self.add_op("BUILD_TUPLE", len(elems))
         self.add_op("STORE_NAME", dst_ident)
@@ -7,7 +7,7 @@ Elements can be identifiers or literal constants.
 from typing import Any
 
 from paxy.commands.base import Command
-from paxy.compiler.ir import Ident
+from paxy.compiler.ir import Ident, plain_name
 
 
 class VecCommand(Command):
@@ -22,11 +22,10 @@ class VecCommand(Command):
     def make_ops(self, op_args: list[Any]) -> None:
         if not op_args or not isinstance(op_args[0], Ident):
             raise SyntaxError("VEC expects: VEC <name> [elem ...]")
-        dst = str(op_args[0])
+        dst = plain_name(op_args[0])
         elems = op_args[1:]
 
-        for e in elems:
-            self._emit_load_for(e)
+        self._emit_loads(elems)
         self.add_op("BUILD_LIST", len(elems))
         self.add_op("STORE_NAME", dst)
 
@@ -1,14 +1,32 @@
 # paxy/assembler.py
+#
+# Perf notes: assembly is allocation-bound, not compute- or I/O-bound. The
+# cost is in creating Python objects (Instr, Label, IR nodes, list and dict
+# entries) and in bytecode's per-object validation, so wins come from making
+# fewer or cheaper objects:
+#   - fastinstr.new_instr / new_bytecode skip redundant validation,
+#   - twelve.to_code skips the CFG pass for straight-line code,
+#   - _first_pass_rewrite links jumps in one pass through LabelState.
+# Numba, Cython or SIMD do not help here: the hot objects are PyObjects
+# owned by the bytecode library. Nor do NumPy struct-of-arrays layouts: jumps
+# hold their target Label object directly, so there are no label positions to
+# search, and every item ends up as an Instr anyway. For the same reason
+# emitters do not stage raw (name, arg) tuples for a later lifting pass:
+# new_instr already skips Instr.__init__, so lifting would only add a walk.
 
-import os
 import sys
-from typing import Any, TypeAlias, Union
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import CodeType
+from typing import Optional, TypeAlias, Union
 
-from bytecode import Bytecode, CompilerFlags, Instr, Label
+from bytecode import CompilerFlags, Instr, Label
 
+from paxy.compiler.fastinstr import new_bytecode, new_instr
+from paxy.compiler.flags import DEBUG
 from paxy.compiler.ir import (
-    COND_JUMP_OPS,
-    UNCOND_JUMP_FIXED,
+    JUMP_OPS,
     FuncDef,
     Ident,
     JumpRef,
@@ -17,28 +35,53 @@ from paxy.compiler.ir import (
     ParsedItem,
     RangeBlock,
     ReturnMarker,
+    plain_name,
 )
 from paxy.compiler.twelve import (
     normalize_push_null_for_calls_312_seq,
+    to_code,
     try_func_to_code_with_endfor_fix,
 )
 
-DROP_NAMES = {"RESUME", "RETURN_VALUE", "RETURN_CONST"}
+DROP_NAMES = frozenset({"RESUME", "RETURN_VALUE", "RETURN_CONST"})
+
+# Name ops that bind a function local, and every op the local rewrite touches
+_LOCAL_DEF_OPS = frozenset({"STORE_NAME", "DELETE_NAME", "STORE_FAST", "DELETE_FAST"})
+_REWRITE_OPS = _LOCAL_DEF_OPS | {"LOAD_NAME", "LOAD_FAST"}
 
 
 # What the resolver returns (only real bytecode items)
 ResolvedItem = Union[Instr, Label]
-# Internal placeholder tuple type (tagged unions used in the first pass)
-Placeholder = tuple[Any, ...]
+
+
+class JumpKind(IntEnum):
+    """Where a forward jump came from (only affects error messages)."""
+
+    GO = 0  # JumpRef (GO <label>): direction picked by the assembler
+    FIXED = 1  # opcode given (IF, NamedJump, native jumps with string targets)
+
+
+@dataclass(slots=True)
+class LabelState:
+    """Everything the first pass tracks per label name, behind one dict probe."""
+
+    label: Label = field(default_factory=Label)
+    declared: bool = False
+    # kind of the first jump to this name (only used for error messages)
+    ref_kind: Optional[JumpKind] = None
+
+
 # First-pass stream must accept anything we temporarily carry
 # and must match normalize_push_null_for_calls_312_seq's parameter/return type.
 StreamItem: TypeAlias = Union[Instr, Label, object]
 
 
+# LOAD_GLOBAL's NULL bit is only taken from the arg tuple on 3.13+
+_LG_PUSH_NULL = sys.version_info >= (3, 13)
+
+
 def _lg(name: str) -> tuple[bool, str]:
-    if sys.version_info >= (3, 13):
-        return (True, name)
-    return (False, name)
+    return (_LG_PUSH_NULL, name)
 
 
 class Assembler:
@@ -46,190 +89,138 @@ class Assembler:
     and lowers function placeholders into LOAD_CONST/MAKE_FUNCTION/STORE_NAME.
     """
 
-    # Placeholder tags
-    TAG_JUMP = "__JUMP__"  # ("__JUMP__", JumpRef)
-    TAG_CJUMP = "__CJUMP__"  # ("__CJUMP__", opcode, JumpRef)
-    TAG_UJUMP = "__UJUMP__"  # ("__UJUMP__", opcode, JumpRef)
-    TAG_NJUMP = "__NJUMP__"  # ("__NJUMP__", opcode, JumpRef)
+    # One Assembler is built per SUB body; slots keep that cheap to allocate
+    # and turn the state lookups in the passes into slot loads.
+    __slots__ = (
+        "items",
+        "_in_function",
+        "_labels",
+        "_resolved_stream",
+        "_final",
+        "first_lineno",
+    )
 
     def __init__(self, items: list[ParsedItem], *, in_function: bool = False) -> None:
         self.items: list[ParsedItem] = items
         self._in_function: bool = in_function
 
-        # discovery
-        self._label_positions: dict[str, int] = {}
-        self._label_objects: dict[str, Label] = {}
+        # label name -> its state, created by the defaultdict on first
+        # touch (declaration *or* reference), so one probe always suffices
+        self._labels: defaultdict[str, LabelState] = defaultdict(LabelState)
 
-        # first pass (rewritten stream)
+        # first pass (rewritten stream, jumps linked)
         self._resolved_stream: list[StreamItem] = []
-        self._decl_idx_to_resolved_idx: dict[int, int] = {}
-
-        # second pass (label/jump-patched stream)
-        self._patched: list[Union[Instr, Label, FuncDef, ReturnMarker]] = []
 
-        # final result (Instr/Label only)
+        # final result (Instr/Label only). Not pooled across Assemblers:
+        # resolve() hands this list to the caller, and clearing a reused list
+        # measured slower than CPython allocating a fresh one.
         self._final: list[ResolvedItem] = []
-
-        # name -> index in resolved stream where concrete Label lives
-        self._name_to_resolved_index: dict[str, int] = {}
+        # lineno of the first Instr (with a line number) in the final stream
+        self.first_lineno: Optional[int] = None
 
     # ---------- Public API ----------
 
     def resolve(self) -> list[ResolvedItem]:
         """Run all passes and return a stream of Instr/Label only."""
-        self._discover_declared_labels()
-        self._build_label_objects()
         self._first_pass_rewrite()
-        self._index_label_decls()
-        self._second_pass_patch_jumps()
         self._lower_functions_and_returns()
-        self._sanity_check()
         return self._final
 
-    # ---------- Pass 1a: Discover labels ----------
-
-    def _discover_declared_labels(self) -> None:
-        """Scan the original items and record label declaration positions."""
-        for idx, it in enumerate(self.items):
-            if isinstance(it, LabelDecl):
-                if it.label_name in self._label_positions:
-                    raise SyntaxError(f"Duplicate LBL '{it.label_name}'")
-                self._label_positions[it.label_name] = idx
-
-    # ---------- Pass 1b: Create Label objects ----------
-
-    def _build_label_objects(self) -> None:
-        """Create concrete bytecode.Label objects for every declared name."""
-        self._label_objects = {name: Label() for name in self._label_positions}
-
-    # ---------- Pass 1c: Rewrite stream to placeholders ----------
+    # ---------- Pass 1: Rewrite stream and link labels/jumps ----------
 
     def _first_pass_rewrite(self) -> None:
         """
-        Build a temporary stream where:
-          - LabelDecl -> Label()
-          - GO (JumpRef) -> ("__JUMP__", JumpRef)
-          - Native jumps with string targets -> ("__C/U/NJUMP__", opcode, JumpRef)
+        Single pass over the parsed items:
+          - LabelDecl -> its Label()
+          - every jump -> real Instr immediately, sharing the target's Label
+            even if the LBL comes later (GO picks JUMP_BACKWARD when the LBL
+            was already seen, JUMP_FORWARD otherwise)
+          - targets still undeclared at the end are reported as errors
           - FuncDef / ReturnMarker are passed through for a later lowering pass
           - Other Instrs are kept as-is.
         """
         resolved: list[StreamItem] = []
-        decl_map: dict[int, int] = {}
+        labels = self._labels
+
+        # Dispatch on the exact type: IR nodes and Instr are never subclassed
+        # here, and an identity test is cheaper than an isinstance chain.
+        for it in self.items:
+            # plain Instrs dominate the stream, so they are tested first
+            if type(it) is Instr:
+                # conditional and fixed jumps share one kind: one probe covers both
+                arg = it.arg
+                if it.name in JUMP_OPS and isinstance(arg, str):  # str or Ident
+                    st = labels[plain_name(arg)]
+                    self._link_jump(resolved, st, JumpKind.FIXED, it.name, it.lineno)
+                else:
+                    resolved.append(it)
 
-        for idx, it in enumerate(self.items):
-            if isinstance(it, LabelDecl):
-                lbl = self._label_objects[it.label_name]
-                decl_map[idx] = len(resolved)
-                resolved.append(lbl)
+            elif type(it) is LabelDecl:
+                st = labels[it.label_name]
+                if st.declared:
+                    raise SyntaxError(f"Duplicate LBL '{it.label_name}'")
+                st.declared = True
+                resolved.append(st.label)
 
-            elif isinstance(it, JumpRef):
-                resolved.append((self.TAG_JUMP, it))
+            elif type(it) is JumpRef:
+                st = labels[it.target_name]
+                opcode = "JUMP_BACKWARD" if st.declared else "JUMP_FORWARD"
+                self._link_jump(resolved, st, JumpKind.GO, opcode, it.lineno)
 
-            elif isinstance(it, NamedJump):
-                # Defer to pass 2—convert to real Instr with Label later
-                resolved.append(
-                    (self.TAG_NJUMP, it.opcode, JumpRef(it.target_name, it.lineno))
-                )
+            elif type(it) is NamedJump:
+                st = labels[it.target_name]
+                self._link_jump(resolved, st, JumpKind.FIXED, it.opcode, it.lineno)
 
-            elif isinstance(it, RangeBlock):
+            elif type(it) is RangeBlock:
                 # Lower RNG var start end ... RNE into concrete loop skeleton,
                 # leaving the body items raw so later passes can still process them.
                 # range(start, end)
                 resolved.extend(self._lower_rangeblock_to_stream(it))
 
-            elif isinstance(it, FuncDef) or isinstance(it, ReturnMarker):
-                # Leave function placeholders and returns for a later lowering stage
-                resolved.append(it)
-
-            elif isinstance(it, Instr) and isinstance(it.name, str):
-                op = it.name
-                arg = it.arg
-                if op in COND_JUMP_OPS and isinstance(arg, (str, Ident)):
-                    resolved.append((self.TAG_CJUMP, op, JumpRef(str(arg), it.lineno)))
-                elif op in UNCOND_JUMP_FIXED and isinstance(arg, (str, Ident)):
-                    resolved.append((self.TAG_UJUMP, op, JumpRef(str(arg), it.lineno)))
-                else:
-                    resolved.append(it)
-
             else:
+                # FuncDef / ReturnMarker are left for a later lowering stage;
+                # anything else passes through unchanged
                 resolved.append(it)
 
+        # States are inserted on first touch, so the first undeclared one is
+        # the earliest-referenced undefined label.
+        for name, st in labels.items():
+            if not st.declared:
+                what = "GO" if st.ref_kind is JumpKind.GO else "jump"
+                raise SyntaxError(f"{what} to undefined LBL '{name}'")
+
         self._resolved_stream = resolved
         self._normalize_push_null_for_calls_312()
-        self._decl_idx_to_resolved_idx = decl_map
-
-    # ---------- Pass 1d: Build name -> resolved index map ----------
 
-    def _index_label_decls(self) -> None:
-        """Map label names to their position in the resolved stream (where Label() lives)."""
-        name_to_resolved_index: dict[str, int] = {}
-        for decl_idx, res_idx in self._decl_idx_to_resolved_idx.items():
-            ld = self.items[decl_idx]
-            if not isinstance(ld, LabelDecl):
-                # Internal invariant
-                raise RuntimeError(
-                    "internal error: decl index did not point to LabelDecl"
-                )
-            name_to_resolved_index[ld.label_name] = res_idx
-        self._name_to_resolved_index = name_to_resolved_index
-
-    # ---------- Pass 2: Patch label-related placeholders to real Instrs ----------
-
-    def _second_pass_patch_jumps(self) -> None:
-        patched: list[Union[Instr, Label, FuncDef, ReturnMarker]] = []
-        for pos, entry in enumerate(self._resolved_stream):
-            if isinstance(entry, tuple):
-                tag = entry[0]
-                if tag == self.TAG_JUMP:
-                    _, ref = entry
-                    patched.append(self._make_resolved_uncond_jump(pos, ref))
-                elif tag == self.TAG_CJUMP:
-                    _, opcode, ref = entry
-                    patched.append(self._make_resolved_fixed_jump(opcode, ref))
-                elif tag == self.TAG_UJUMP:
-                    _, opcode, ref = entry
-                    patched.append(self._make_resolved_fixed_jump(opcode, ref))
-                elif tag == self.TAG_NJUMP:
-                    _, opcode, ref = entry
-                    patched.append(self._make_resolved_fixed_jump(opcode, ref))
-                else:
-                    raise RuntimeError(f"unknown placeholder {tag!r}")
-            else:
-                if isinstance(entry, (Instr, Label, FuncDef, ReturnMarker)):
-                    patched.append(entry)
-                else:
-                    raise RuntimeError(
-                        f"unexpected item in resolved stream: {type(entry)!r}"
-                    )
-
-        self._patched = patched
-
-    def _make_resolved_uncond_jump(self, pos: int, ref: JumpRef) -> Instr:
-        target_idx = self._lookup_target_index(ref.target_name)
-        opcode = "JUMP_FORWARD" if target_idx > pos else "JUMP_BACKWARD"
-        return Instr(opcode, self._label_objects[ref.target_name], lineno=ref.lineno)
-
-    def _make_resolved_fixed_jump(self, opcode: str, ref: JumpRef) -> Instr:
-        self._ensure_target_defined(ref.target_name)
-        return Instr(opcode, self._label_objects[ref.target_name], lineno=ref.lineno)
+    def _link_jump(
+        self,
+        resolved: list[StreamItem],
+        st: LabelState,
+        kind: JumpKind,
+        opcode: str,
+        lineno: int,
+    ) -> None:
+        """Emit a jump to st's Label now, even if its LBL comes later."""
+        if st.ref_kind is None:
+            st.ref_kind = kind
+        resolved.append(self._make_resolved_jump(opcode, st.label, lineno))
+
+    @staticmethod
+    def _make_resolved_jump(opcode: str, label: Label, lineno: int) -> Instr:
+        # Each jump gets its own Instr: Bytecode.legalize() and the 3.12
+        # fixups mutate instructions in place, so sharing them is unsafe.
+        return new_instr(opcode, label, lineno=lineno)
 
     def _lower_funcdef(self, func: FuncDef) -> list[ResolvedItem]:
         # 1) Resolve body inside-function
         inner_resolved = Assembler(func.body, in_function=True).resolve()
 
-        # 2) Rewrite locals/globals
-        lowered_body = self._rewrite_locals_for_function(
-            inner_resolved, list(func.params)
+        # 2) Rewrite locals/globals, dropping mid-body RESUMEs on the way
+        lowered_body, has_any_return = self._rewrite_locals_for_function(
+            inner_resolved, func.params
         )
 
-        # 3) Sanitize mid-body RESUMEs and spurious default returns
-        lowered_body = self._sanitize_function_body(lowered_body)
-
-        # 4) Ensure *some* return exists (only if none at all after sanitize)
-        has_any_return = any(
-            isinstance(ins, Instr) and ins.name == "RETURN_VALUE"
-            for ins in lowered_body
-        )
+        # 3) Ensure *some* return exists (only if none at all after rewrite)
         if not has_any_return:
             lowered_body.extend(
                 [
@@ -238,133 +229,113 @@ class Assembler:
                 ]
             )
 
-        # 5) (optional) debug
-        if os.getenv("PAXY_DEBUG") == "1":
+        # 4) (optional) debug
+        if DEBUG:
             print(f"== FUNC {func.name} AFTER REWRITE ==")
             for i, ins in enumerate(lowered_body):
                 print(f"{i:03d}: {ins!r}")
 
-        # 6) Build code object FROM lowered_body
-        bc_func = Bytecode(lowered_body)
-        bc_func.argcount = len(func.params)
-        bc_func.argnames = list(func.params)
-        bc_func.flags |= (
-            CompilerFlags.OPTIMIZED | CompilerFlags.NEWLOCALS | CompilerFlags.NOFREE
-        )
-        bc_func.first_lineno = func.lineno
-
+        # 5) Build code object FROM lowered_body
         if sys.version_info >= (3, 13):
             maker = Instr("MAKE_FUNCTION", lineno=func.lineno)
-            func_code = bc_func.to_code()
         else:
             maker = Instr("MAKE_FUNCTION", 0, lineno=func.lineno)
-            func_code = try_func_to_code_with_endfor_fix(bc_func)
 
-        # 7) Emit loader sequence
+        func_code = self._func_to_code(func, lowered_body)
+
+        # 6) Emit loader sequence
         return [
             Instr("LOAD_CONST", func_code, lineno=func.lineno),
             maker,
             Instr("STORE_NAME", func.name, lineno=func.lineno),
         ]
 
+    @staticmethod
+    def _func_to_code(func: FuncDef, lowered_body: list[ResolvedItem]) -> CodeType:
+        bc_func = new_bytecode(lowered_body)
+        bc_func.argcount = len(func.params)
+        bc_func.argnames = list(func.params)
+        bc_func.flags |= (
+            CompilerFlags.OPTIMIZED | CompilerFlags.NEWLOCALS | CompilerFlags.NOFREE
+        )
+        bc_func.first_lineno = func.lineno
+
+        if sys.version_info >= (3, 13):
+            return to_code(bc_func)
+        return try_func_to_code_with_endfor_fix(bc_func)
+
     # ---------- Pass 3: Lower functions and returns ----------
 
     def _rewrite_locals_for_function(
         self,
         lowered_body: list[ResolvedItem],
         params: list[str],
-    ) -> list[ResolvedItem]:
+    ) -> tuple[list[ResolvedItem], bool]:
         """
         Convert NAME ops to FAST for locals (params + anything stored/deleted),
         and LOAD_NAME(non-local) -> LOAD_GLOBAL with 3.13 bitflag tuple.
         Also normalize Ident args to str for all FAST ops.
+
+        The same walk keeps only the first RESUME and notes whether any
+        RETURN_VALUE is present. Returns (body, has_return).
         """
-        # 1) discover locals
-        local_names: set[str] = set(params)
+        # 1) discover locals (only stores/deletes matter)
+        local_names: set[str] = {plain_name(p) for p in params}
         for ins in lowered_body:
-            if isinstance(ins, Instr):
-                nm = ins.name
+            if type(ins) is Instr and ins.name in _LOCAL_DEF_OPS:
                 arg = ins.arg
-                if nm in ("STORE_NAME", "DELETE_NAME", "STORE_FAST", "DELETE_FAST"):
-                    if isinstance(arg, (str, Ident)):
-                        local_names.add(self._as_name(arg))
+                if isinstance(arg, str):  # Ident is a str subclass
+                    local_names.add(plain_name(arg))
 
-        # 2) rewrite
+        # 2) rewrite + sanitize
         out: list[ResolvedItem] = []
+        append = out.append
+        saw_resume = False
+        saw_return = False
         for ins in lowered_body:
             if not isinstance(ins, Instr):
-                out.append(ins)
+                append(ins)
                 continue
 
             nm = ins.name
-            arg = ins.arg
-
-            if isinstance(arg, (str, Ident)):
-                name = self._as_name(arg)
-
-                if nm == "LOAD_NAME":
-                    if name in local_names:
-                        out.append(Instr("LOAD_FAST", name, lineno=ins.lineno))
+            if nm in _REWRITE_OPS:
+                arg = ins.arg
+                if isinstance(arg, str):
+                    name = plain_name(arg)
+                    if nm == "LOAD_NAME":
+                        if name in local_names:
+                            append(new_instr("LOAD_FAST", name, lineno=ins.lineno))
+                        else:
+                            # CPython 3.13: LOAD_GLOBAL requires (bool, name) tuple
+                            append(
+                                new_instr("LOAD_GLOBAL", _lg(name), lineno=ins.lineno)
+                            )
+                    elif nm == "STORE_NAME":
+                        append(new_instr("STORE_FAST", name, lineno=ins.lineno))
+                    elif nm == "DELETE_NAME":
+                        append(new_instr("DELETE_FAST", name, lineno=ins.lineno))
+                    elif type(arg) is str:
+                        # FAST op already carrying a plain str: keep as-is
+                        append(ins)
                     else:
-                        # CPython 3.13: LOAD_GLOBAL requires (bool, name) tuple
-                        out.append(Instr("LOAD_GLOBAL", _lg(name), lineno=ins.lineno))
-                    continue
-
-                if nm == "STORE_NAME":
-                    out.append(Instr("STORE_FAST", name, lineno=ins.lineno))
-                    continue
-
-                if nm == "DELETE_NAME":
-                    out.append(Instr("DELETE_FAST", name, lineno=ins.lineno))
+                        append(new_instr(nm, name, lineno=ins.lineno))
                     continue
-
-                if nm in ("LOAD_FAST", "STORE_FAST", "DELETE_FAST"):
-                    out.append(Instr(nm, name, lineno=ins.lineno))
+            elif nm == "RESUME":
+                if saw_resume:
                     continue
+                saw_resume = True
+            elif nm == "RETURN_VALUE":
+                saw_return = True
 
-            # default: pass through unchanged
-            out.append(ins)
-
-        # 3) sanity in optimized functions: no *_NAME left
-        leftovers = [
-            (i, ins.name, ins.arg, getattr(ins, "lineno", None))
-            for i, ins in enumerate(out)
-            if isinstance(ins, Instr) and ins.name.endswith("_NAME")
-        ]
-        if leftovers:
-            details = ", ".join(
-                f"{idx}:{nm}:{arg}@{ln}" for idx, nm, arg, ln in leftovers
-            )
-            raise RuntimeError(
-                f"internal: NAME ops remain in optimized function after rewrite: {details}"
-            )
-        return out
-
-    def _rewrite_names_global_mode(
-        self,
-        body: list[ResolvedItem],
-    ) -> list[ResolvedItem]:
-        """
-        Zero-arg SUBs behave like classic subroutines: assignments are global.
-        Rewrite:
-        STORE_NAME x -> STORE_GLOBAL x
-        LOAD_NAME  x -> LOAD_GLOBAL x
-        (Other ops unchanged.)
-        """
-        out: list[ResolvedItem] = []
-        for ins in body:
-            if not isinstance(ins, Instr):
-                out.append(ins)
-                continue
-
-            if ins.name == "STORE_NAME" and isinstance(ins.arg, str):
-                out.append(Instr("STORE_GLOBAL", ins.arg, lineno=ins.lineno))
-            elif ins.name == "LOAD_NAME" and isinstance(ins.arg, str):
-                out.append(Instr("LOAD_GLOBAL", _lg(ins.arg), lineno=ins.lineno))
-            else:
-                out.append(ins)
+            # sanity in optimized functions: no *_NAME left
+            if nm.endswith("_NAME"):
+                raise RuntimeError(
+                    "internal: NAME ops remain in optimized function after rewrite: "
+                    f"{len(out)}:{nm}:{ins.arg}@{getattr(ins, 'lineno', None)}"
+                )
+            append(ins)
 
-        return out
+        return out, saw_return
 
     def _lower_functions_and_returns(self) -> None:
         """
@@ -373,13 +344,34 @@ class Assembler:
           - ReturnMarker:
               * in module context -> error
               * in function context -> RETURN_VALUE or RETURN_CONST 0
+
+        Also checks that every jump op targets a real Label as items are
+        appended, so no separate sanity pass over the result is needed.
+        Records first_lineno on the way.
         """
         final: list[ResolvedItem] = []
-        for entry in self._patched:
-            if isinstance(entry, FuncDef):
+        first_lineno: Optional[int] = None
+        # Hand the intermediate stream over to this pass so it is freed on
+        # return instead of living on next to the final list.
+        stream, self._resolved_stream = self._resolved_stream, []
+        for entry in stream:
+            if type(entry) is Instr:
+                # Jumps we built already carry Labels; pass-through ones may not
+                # (e.g. native jumps copied in from RNG bodies). User-facing, so
+                # it must hold under python -O too.
+                if entry.name in JUMP_OPS:
+                    if not isinstance(entry.arg, Label):
+                        raise RuntimeError(f"jump still has non-Label arg: {entry!r}")
+                final.append(entry)
+                if first_lineno is None:
+                    first_lineno = entry.lineno or None
+
+            elif type(entry) is FuncDef:
                 final.extend(self._lower_funcdef(entry))
+                if first_lineno is None:
+                    first_lineno = entry.lineno or None
 
-            elif isinstance(entry, ReturnMarker):
+            elif type(entry) is ReturnMarker:
                 if not self._in_function:
                     # RET outside of function/subroutine is invalid
                     raise SyntaxError("RET outside of SUB")
@@ -393,50 +385,22 @@ class Assembler:
                             Instr("RETURN_VALUE", lineno=entry.lineno),
                         ]
                     )
+                if first_lineno is None:
+                    first_lineno = entry.lineno or None
 
-            else:
-                # Instr or Label
+            elif type(entry) is Label:
                 final.append(entry)
 
+            else:
+                raise RuntimeError(
+                    f"unexpected item in resolved stream: {type(entry)!r}"
+                )
+
         self._final = final
+        self.first_lineno = first_lineno
 
     # ---------- Helpers ----------
 
-    def _as_name(self, arg: object) -> str:
-        """Return identifier name as a plain str (accept Ident or str)."""
-        if isinstance(arg, Ident):
-            return str(arg)
-        if isinstance(arg, str):
-            return arg
-        return str(arg)
-
-    def _sanity_check(self) -> None:
-        """
-        Final pass invariants:
-          - No tuple placeholders remain.
-          - Any jump op still present targets a real Label.
-        """
-        for obj in self._final:
-            # Should never see placeholders in the final stream
-            if isinstance(obj, tuple):
-                raise RuntimeError(f"unresolved jump placeholder: {obj!r}")
-
-            # For real instructions, verify jump args are Labels
-            if isinstance(obj, Instr):
-                if obj.name in (COND_JUMP_OPS | UNCOND_JUMP_FIXED):
-                    if not isinstance(obj.arg, Label):
-                        raise RuntimeError(f"jump still has non-Label arg: {obj!r}")
-
-    def _lookup_target_index(self, name: str) -> int:
-        idx = self._name_to_resolved_index.get(name)
-        if idx is None:
-            raise SyntaxError(f"GO to undefined LBL '{name}'")
-        return idx
-
-    def _ensure_target_defined(self, name: str) -> None:
-        if name not in self._name_to_resolved_index:
-            raise SyntaxError(f"jump to undefined LBL '{name}'")
-
     def _emit_token_load_instrs(self, tok: object, lineno: int) -> list[Instr]:
         """
         Helper: load a parsed token either as a local/global name or a constant.
@@ -469,11 +433,7 @@ class Assembler:
             END_FOR
             POP_TOP
         """
-        out: list[StreamItem] = []
-
-        # 1) Build iter(range(...))
-        out.append(Instr("PUSH_NULL", lineno=it.lineno))
-        out.append(Instr("LOAD_GLOBAL", _lg("range"), lineno=it.lineno))
+        ln = it.lineno
 
         # Collect start/end[/step]
         args: list[object] = [it.start, it.end]
@@ -481,66 +441,47 @@ class Assembler:
         if step is not None:
             args.append(step)
 
-        for tok in args:
-            out.extend(self._emit_token_load_instrs(tok, it.lineno))
-
-        out.append(Instr("CALL", len(args), lineno=it.lineno))
-        out.append(Instr("GET_ITER", lineno=it.lineno))
-
-        # 2) Loop skeleton
         l_loop = Label()
         l_end = Label()
-        out.append(l_loop)
-        out.append(Instr("FOR_ITER", l_end, lineno=it.lineno))
-        out.append(Instr("STORE_NAME", it.var, lineno=it.lineno))
 
-        # 3) Splice body, dropping line bookends and the sentinel LOAD_CONST 0
-        for ins in it.body:
-            if isinstance(ins, Instr):
-                if ins.name in DROP_NAMES:
-                    continue
-                # Filter the sentinel that precedes implicit returns in single-line lowering
-                if ins.name == "LOAD_CONST" and ins.arg == 0:
-                    continue
-            out.append(ins)
+        # 1) Build iter(range(...)), then 2) the loop head, in one literal
+        out: list[StreamItem] = [
+            Instr("PUSH_NULL", lineno=ln),
+            Instr("LOAD_GLOBAL", _lg("range"), lineno=ln),
+        ]
+        for tok in args:
+            out += self._emit_token_load_instrs(tok, ln)
+        out += (
+            Instr("CALL", len(args), lineno=ln),
+            Instr("GET_ITER", lineno=ln),
+            l_loop,
+            Instr("FOR_ITER", l_end, lineno=ln),
+            Instr("STORE_NAME", it.var, lineno=ln),
+        )
 
-        out.append(Instr("JUMP_BACKWARD", l_loop, lineno=it.lineno))
+        # 3) Splice body, dropping line bookends and the sentinel LOAD_CONST 0
+        #    (the sentinel precedes implicit returns in single-line lowering)
+        out += [
+            ins
+            for ins in it.body
+            if not (
+                isinstance(ins, Instr)
+                and (
+                    ins.name in DROP_NAMES
+                    or (ins.name == "LOAD_CONST" and ins.arg == 0)
+                )
+            )
+        ]
 
         # 4) Loop end + cleanup (tests want POP_TOP present)
-        out.append(l_end)
-        out.append(Instr("END_FOR", lineno=it.lineno))
-        # if sys.version_info >= (3, 13):
-        out.append(Instr("POP_TOP", lineno=it.lineno))
-
+        out += (
+            Instr("JUMP_BACKWARD", l_loop, lineno=ln),
+            l_end,
+            Instr("END_FOR", lineno=ln),
+            Instr("POP_TOP", lineno=ln),
+        )
         return out
 
-    def _sanitize_function_body(self, body: list[ResolvedItem]) -> list[ResolvedItem]:
-        """Remove mid-body RESUMEs and default RETURN_CONST if there is an explicit return."""
-        # Keep only the first RESUME
-        saw_resume = False
-        tmp: list[ResolvedItem] = []
-        for ins in body:
-            if isinstance(ins, Instr) and ins.name == "RESUME":
-                if saw_resume:
-                    continue
-                saw_resume = True
-                tmp.append(ins)
-            else:
-                tmp.append(ins)
-
-        # # If there is any explicit RETURN_VALUE, remove all RETURN_CONST
-        # has_explicit_return = any(
-        #     isinstance(ins, Instr) and ins.name == "RETURN_VALUE" for ins in tmp
-        # )
-        # if has_explicit_return:
-        #     tmp = [
-        #         ins
-        #         for ins in tmp
-        #         if not (isinstance(ins, Instr) and ins.name == "RETURN_CONST")
-        #     ]
-
-        return tmp
-
     def _normalize_push_null_for_calls_312(self) -> None:
         """On Py 3.12 only, make sure PUSH_NULL is *under* the callable."""
         self._resolved_stream = normalize_push_null_for_calls_312_seq(
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
 import marshal
+import os
 import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from importlib import _bootstrap_external as bootstrap
 from importlib._bootstrap_external import (
     _code_to_timestamp_pyc as code_to_timestamp_pyc,
 )
 from importlib._bootstrap_external import _write_atomic as write_atomic
 from importlib.util import source_hash
+from itertools import repeat
 from pathlib import Path
 from types import CodeType, ModuleType
-from typing import Optional
+from typing import Iterable, Optional
 
-from bytecode import Bytecode, CompilerFlags, Instr
+from bytecode import CompilerFlags
 
 from paxy.compiler.assembler import Assembler
 from paxy.compiler.debug import debug_dump, emit_debugdis
+from paxy.compiler.fastinstr import new_bytecode
+from paxy.compiler.flags import DEBUG
 from paxy.compiler.parser import Parser
 from paxy.compiler.twelve import transpile_for_twelve
 
@@ -34,39 +39,55 @@ class PaxyCompiler:
     ) -> None:
         self.path = Path(path)
         self.verbose = verbose
-        self.no_cache = no_cache
+        # PAXY_NO_CACHE=1 disables the pyc cache like --no-cache; so does
+        # PAXY_DEBUG, since a cache hit would skip the debug dumps.
+        env_no_cache = os.getenv("PAXY_NO_CACHE", "") not in ("", "0")
+        self.no_cache = no_cache or DEBUG or env_no_cache
+        # pyc_path() per optimization level, resolved once per instance
+        self._pyc_paths: dict[Optional[int], Path] = {}
+        # pyc the last assemble() wrote or found current (hash-based and
+        # matching), so compile_pyc() need not marshal and write it again
+        self._current_pyc: Optional[Path] = None
 
     # ---------- core ----------
     def assemble(self) -> CodeType:
+        # Read the source once: it feeds both the cache key and the parser.
+        # Plain read_bytes() beats mmap until sources reach megabytes, and a
+        # miss needs real bytes for the tokenizer anyway.
+        source = self.path.read_bytes()
+        src_hash = source_hash(source)
+        # Resolve the pyc location once too (it stats for a sibling .py)
+        pyc = None if self.no_cache else self.pyc_path()
+        self._current_pyc = None
+
         # Try cache first (unless disabled)
-        if not self.no_cache:
-            cached = self._load_from_cache()
+        if pyc is not None:
+            cached = self._load_from_cache(src_hash=src_hash, pyc=pyc)
             if cached is not None:
                 return cached
 
         # Compile fresh
-        parsed = Parser().parse_file(self.path)
-        resolved = Assembler(parsed).resolve()
+        parsed = Parser().parse_bytes(source)
+        asm = Assembler(parsed)
+        resolved = asm.resolve()
         debug_dump(resolved)
 
-        bc = Bytecode(resolved)
+        bc = new_bytecode(resolved)
         bc.filename = str(self.path)
         bc.name = "<module>"
         bc.flags |= CompilerFlags.NOFREE
 
-        # first_lineno if present
-        first_instr = next(
-            (i for i in resolved if isinstance(i, Instr) and i.lineno), None
-        )
-        if first_instr:
-            bc.first_lineno = first_instr.lineno
+        # first_lineno if present (tracked by the assembler while lowering)
+        if asm.first_lineno:
+            bc.first_lineno = asm.first_lineno
 
         code = transpile_for_twelve(bc)
         emit_debugdis(code)
 
         # Write cache unless disabled
-        if not self.no_cache:
-            self._write_cache(code)
+        if pyc is not None:
+            self._write_cache(code, src_hash=src_hash, pyc=pyc)
+            self._current_pyc = pyc
 
         return code
 
@@ -79,7 +100,17 @@ class PaxyCompiler:
                 __pycache__/hello.<tag>[.opt-N].pyc
         - Otherwise (sourceless) => write a top-level hello.pyc
             so the import system can find it by name.
+
+        Resolved once per optimization level and then memoized, since the
+        choice costs a stat of the sibling .py. The memo is per instance, not
+        process-wide, so a .py created later is seen by the next compiler.
         """
+        out = self._pyc_paths.get(optimization)
+        if out is None:
+            out = self._pyc_paths[optimization] = self._compute_pyc_path(optimization)
+        return out
+
+    def _compute_pyc_path(self, optimization: Optional[int]) -> Path:
         src_py = self.path.with_suffix(".py")
         if not src_py.exists():  # sourceless case
             return self.path.with_suffix(".pyc")  # top-level hello.pyc
@@ -95,13 +126,18 @@ class PaxyCompiler:
         return source_hash(self.path.read_bytes())
 
     def _write_cache(
-        self, code: CodeType, *, optimization: Optional[int] = None
+        self,
+        code: CodeType,
+        *,
+        optimization: Optional[int] = None,
+        src_hash: Optional[bytes] = None,
+        pyc: Optional[Path] = None,
     ) -> None:
         """Write a PEP 552 hash-based pyc (checked=True)."""
-        out = self.pyc_path(optimization=optimization)
+        out = pyc if pyc is not None else self.pyc_path(optimization=optimization)
         out.parent.mkdir(parents=True, exist_ok=True)
 
-        h = self._source_hash()
+        h = src_hash if src_hash is not None else self._source_hash()
         # MAGIC (4) + FLAGS (4) + HASH (8) + marshal(code)
         data = bytearray(MAGIC_NUMBER)
         flags = 0b1 | (1 << 1)  # hash-based + checked
@@ -111,39 +147,55 @@ class PaxyCompiler:
         write_atomic(str(out), data, mode=0o644)
 
     def _load_from_cache(
-        self, *, optimization: Optional[int] = None
+        self,
+        *,
+        optimization: Optional[int] = None,
+        src_hash: Optional[bytes] = None,
+        pyc: Optional[Path] = None,
     ) -> Optional[CodeType]:
-        """Return cached CodeType if a hash-based pyc matches current source hash."""
-        pyc = self.pyc_path(optimization=optimization)
-        if not pyc.is_file():
-            return None
+        """Return the cached CodeType if the pyc is current for this source.
 
+        Both PEP 552 header kinds are accepted: a hash-based pyc must carry
+        the current source hash, a timestamp-based one (as written by
+        compile_pyc(hash_based=False)) the source's mtime and size.
+        Pass src_hash and/or pyc when the caller already computed them.
+        """
+        if pyc is None:
+            pyc = self.pyc_path(optimization=optimization)
         try:
-            data = memoryview(pyc.read_bytes())
-            # Basic sanity on MAGIC
-            if bytes(data[:4]) != MAGIC_NUMBER:
-                return None
-
-            word = struct.unpack("<I", data[4:8])[0]
-            if word & 0b1:
-                # hash-based header: FLAGS + HASH
-                cached_hash = bytes(data[8:16])
-                if cached_hash != self._source_hash():
+            # no is_file() pre-check: a missing pyc is just an OSError below
+            with open(pyc, "rb") as f:
+                # Validate the 16-byte header before reading the code, so a
+                # stale pyc (new interpreter, edited source) costs one read.
+                # The code is then read once, with no slicing copies; mmap
+                # would only pay off for multi-megabyte pycs.
+                header = f.read(16)
+                # Basic sanity on MAGIC
+                if header[:4] != MAGIC_NUMBER:
                     return None
-                code: CodeType = marshal.loads(data[16:])
-                return code  # cache hit
 
-            # timestamp-based header (we don't write these, but be forgiving)
-            # MAGIC + TIMESTAMP (4) + SIZE (4)
-            mtime = word
-            size = struct.unpack("<I", data[8:12])[0]
-            st = self.path.stat()
-            if int(st.st_mtime) != mtime or st.st_size != size:
-                return None
-            code = marshal.loads(data[12:])
-            return code
+                word = struct.unpack("<I", header[4:8])[0]
+                if word & 0b1:
+                    # hash-based header: FLAGS + HASH
+                    cached_hash = header[8:16]
+                    if src_hash is None:
+                        src_hash = self._source_hash()
+                    if cached_hash != src_hash:
+                        return None
+                    code: CodeType = marshal.loads(f.read())
+                    self._current_pyc = pyc
+                    return code  # cache hit
+
+                # timestamp-based header (compile_pyc(hash_based=False)):
+                # FLAGS (0) + TIMESTAMP (4) + SIZE (4)
+                mtime, size = struct.unpack("<II", header[8:16])
+                st = self.path.stat()
+                if int(st.st_mtime) & 0xFFFFFFFF != mtime or st.st_size != size:
+                    return None
+                code = marshal.loads(f.read())
+                return code
         except (OSError, EOFError, ValueError, TypeError, struct.error):
-            # OSError: file disappeared between is_file() and read_bytes() or stat race.
+            # OSError: no pyc (or not a file), or a stat race.
             # struct.error: header too short / malformed.
             # EOFError, ValueError, TypeError: marshal.loads on
             # truncated/invalid data or wrong type.
@@ -185,13 +237,65 @@ class PaxyCompiler:
         """Explicit compiler to .pyc; default is hash-based (PEP 552)."""
         code = self.assemble()
         out = self.pyc_path(optimization=optimization)
-        out.parent.mkdir(parents=True, exist_ok=True)
 
         if hash_based:
-            self._write_cache(code, optimization=optimization)
+            # assemble() either just wrote this exact file or validated it
+            # by hash; either way don't marshal and write it a second time.
+            if out != self._current_pyc:
+                self._write_cache(code, optimization=optimization, pyc=out)
         else:
-            # timestamp-based for completeness
+            out.parent.mkdir(parents=True, exist_ok=True)
+            # timestamp-based for completeness; stamped with the source's
+            # mtime and size (as py_compile does), never the wall clock
             st = self.path.stat()
             data = code_to_timestamp_pyc(code, int(st.st_mtime), st.st_size)
             write_atomic(str(out), data, mode=0o644)
         return out
+
+
+def _compile_pyc_worker(
+    path: Path, hash_based: bool, optimization: Optional[int], no_cache: bool
+) -> Path:
+    compiler = PaxyCompiler(path, no_cache=no_cache)
+    return compiler.compile_pyc(hash_based=hash_based, optimization=optimization)
+
+
+def compile_files(
+    paths: Iterable[str | Path],
+    *,
+    hash_based: bool = True,
+    optimization: Optional[int] = None,
+    no_cache: bool = False,
+    max_workers: Optional[int] = None,
+) -> list[Path]:
+    """Compile several sources to .pyc, up to one process per CPU for batches.
+
+    Each file is independent, so a batch scales with cores instead of being
+    serialized on the GIL. The pool never has more workers than files, and a
+    single file (or a single worker) is compiled in-process, skipping the
+    pool's startup cost. Returns the .pyc paths in input order.
+
+    Each worker writes its own pyc with the stdlib's atomic write, so writes
+    overlap across processes without a batched I/O layer.
+    """
+    srcs = [Path(p) for p in paths]
+    # never more processes than files: each worker costs an interpreter start
+    workers = min(max_workers or os.cpu_count() or 1, len(srcs))
+    if workers <= 1:
+        return [
+            _compile_pyc_worker(p, hash_based, optimization, no_cache) for p in srcs
+        ]
+    # A few chunks per worker: large batches pay less per-file IPC, while
+    # uneven file sizes still balance across the pool.
+    chunksize = max(1, len(srcs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                _compile_pyc_worker,
+                srcs,
+                repeat(hash_based),
+                repeat(optimization),
+                repeat(no_cache),
+                chunksize=chunksize,
+            )
+        )
@@ -5,22 +5,24 @@ import sys
 from contextlib import redirect_stdout
 from pathlib import Path
 from types import CodeType
-from typing import Iterable, Sequence, Union
+from typing import Final, Iterable, Sequence, Union
 
 from bytecode import Bytecode, Instr, Label
 
+from paxy.compiler.flags import DEBUG
 from paxy.compiler.twelve import normalize_push_null_for_calls_312_seq
 
+DEBUG_OUT: Final[Path] = Path(os.getenv("PAXY_DEBUG_OUT", "/tmp/paxy_debug.txt"))
+
 
 def _dbg_enabled() -> bool:
-    v = os.getenv("PAXY_DEBUG")
-    return bool(v) and v != "0"
+    return DEBUG
 
 
 def _dbg_write(text: str) -> None:
     if not _dbg_enabled():
         return
-    with open("/tmp/paxy_debug.txt", "a", encoding="utf-8") as fp:
+    with open(DEBUG_OUT, "a", encoding="utf-8") as fp:
         fp.write(text if text.endswith("\n") else text + "\n")
 
 
@@ -60,17 +62,17 @@ def emit_debugdis(codeobj: CodeType, header: str = "== DISASSEMBLY ==") -> None:
 
 def debug_dump(resolved: Sequence[Union[Instr, Label, object]]) -> None:
     """
-    Append a human-friendly dump of resolved instructions AND a safe disassembly
-    to /tmp/paxy_debug.txt — but only when PAXY_DEBUG is set.
+    Write a human-friendly dump of resolved instructions AND a safe disassembly
+    to DEBUG_OUT (PAXY_DEBUG_OUT) — but only when PAXY_DEBUG is set.
     """
     if not _dbg_enabled():
         return
 
-    lines = ["== RESOLVED =="]
+    buf = io.StringIO()
+    buf.write("== RESOLVED ==\n")
     for i, obj in enumerate(resolved):
-        lines.append(f"{i:03d}: {obj!r}")
-    lines.append("== DISASSEMBLY ==")
-    lines.append(safe_disassemble(resolved))
+        buf.write(f"{i:03d}: {obj!r}\n")
+    buf.write("== DISASSEMBLY ==\n")
+    buf.write(safe_disassemble(resolved))
 
-    out_path = Path(os.getenv("PAXY_DEBUG_OUT", "/tmp/paxy_debug.txt"))
-    out_path.write_text("\n".join(lines))
+    DEBUG_OUT.write_text(buf.getvalue())
@@ -0,0 +1,78 @@
+# paxy/compiler/fastinstr.py
+"""
+Unvalidated Instr/Bytecode construction for the emitters and the assembler.
+
+Paxy only ever builds instructions from literal opcode names with args of
+the right kind, so the opmap/arg checks in bytecode's Instr.__init__ are
+pure overhead on the hot paths.
+"""
+
+from opcode import hasjabs, hasjrel, opmap
+from typing import Any, Sequence, Union
+
+from bytecode import Bytecode, Instr, Label
+from bytecode.instr import UNSET, InstrLocation
+
+from paxy.compiler.flags import DEBUG
+
+# name -> (opcode, is_jump) for every op an emitter may ask for
+_JUMP_CODES = frozenset(hasjrel + hasjabs)
+_OP_INFO = {name: (code, code in _JUMP_CODES) for name, code in opmap.items()}
+
+
+# lineno -> its InstrLocation. Locations are frozen and Instr.lineno's setter
+# replaces rather than mutates them, so one per line can be shared by every
+# Instr on that line (Instrs themselves must not be shared; see add_op).
+_LOCATIONS: dict[int, InstrLocation] = {}
+
+
+def _fast_instr(name: str, arg: Any = UNSET, *, lineno: int) -> Instr:
+    """Build an Instr without bytecode's per-instance validation.
+
+    Unknown names still go through Instr so they fail with its usual error.
+    """
+    info = _OP_INFO.get(name)
+    if info is None:
+        return Instr(name, arg, lineno=lineno)
+    ins: Instr = object.__new__(Instr)
+    ins._opcode, ins._is_jump = info  # type: ignore[attr-defined]
+    ins._name = name  # type: ignore[attr-defined]
+    ins._arg = arg  # type: ignore[attr-defined]
+    loc = _LOCATIONS.get(lineno)
+    if loc is None:
+        loc = _LOCATIONS[lineno] = InstrLocation(lineno, None, None, None)
+    ins._location = loc  # type: ignore[attr-defined]
+    return ins
+
+
+# The fast path writes bytecode's private slots; if a bytecode release ever
+# lays Instr out differently, or under PAXY_DEBUG, use the validating path.
+try:
+    _FAST_EMIT = not DEBUG and _fast_instr("LOAD_CONST", 0, lineno=1) == Instr(
+        "LOAD_CONST", 0, lineno=1
+    )
+except (AttributeError, TypeError):
+    _FAST_EMIT = False
+
+
+def _checked_instr(name: str, arg: Any = UNSET, *, lineno: int) -> Instr:
+    return Instr(name, arg, lineno=lineno)
+
+
+# new_instr(name, arg, lineno=...) is Instr(...), through the fast path when
+# enabled. Bound once here so each call is a single frame.
+new_instr = _fast_instr if _FAST_EMIT else _checked_instr
+
+
+def new_bytecode(items: Sequence[Union[Instr, Label]]) -> Bytecode:
+    """Bytecode(items), without re-checking the type of every item.
+
+    The assembler only ever hands over Instr and Label objects, so the
+    isinstance check Bytecode.extend() runs per item is redundant.
+    """
+    bc = Bytecode()
+    if _FAST_EMIT:
+        list.extend(bc, items)  # type: ignore[arg-type]  # Bytecode is a list
+    else:
+        bc.extend(items)
+    return bc
@@ -0,0 +1,19 @@
+# paxy/compiler/flags.py
+"""
+Environment switches shared across the compiler.
+
+A leaf module (no paxy imports), so debug.py and twelve.py can both read
+the same flag without importing each other.
+"""
+
+import os
+from typing import Final
+
+
+def _env_flag(v: str | None) -> bool:
+    return bool(v) and v != "0"
+
+
+# Read once at import time; changing PAXY_DEBUG later in the same process
+# has no effect (set it before starting paxy). Unset, "" and "0" are off.
+DEBUG: Final[bool] = _env_flag(os.getenv("PAXY_DEBUG"))
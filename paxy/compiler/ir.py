@@ -25,6 +25,7 @@ This IR decouples parsing from assembly:
 explicit: parser → IR → assembler → bytecode.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import List, Union
 
@@ -34,10 +35,33 @@ from bytecode import Instr
 class Ident(str):
     """Marker type for identifiers (NAME tokens). Subclass of str so equality stays normal."""
 
-    pass
+    __slots__ = ()  # one per NAME token: no per-instance __dict__
+    # No "_is_ident" class tag for emitters to probe: isinstance(x, Ident)
+    # on an exact Ident is a pointer compare, and measured faster than
+    # getattr(x, "_is_ident", False) for both Idents and literals.
 
 
-@dataclass(frozen=True)
+# name -> its plain interned str; keyed by that str, so Ident and str
+# lookups of the same spelling share one entry.
+_PLAIN_NAMES: dict[str, str] = {}
+
+
+def plain_name(arg: str) -> str:
+    """Plain interned str for an Ident/str arg, so set/dict probes compare by identity.
+
+    Ident is a str subclass (which cannot take a non-empty __slots__ to carry
+    a cached name), so the plain form is cached per spelling instead: a name
+    is copied and interned once, and every later use is one dict probe.
+    """
+    try:
+        return _PLAIN_NAMES[arg]
+    except KeyError:
+        name = sys.intern(arg if type(arg) is str else str(arg))
+        _PLAIN_NAMES[name] = name
+        return name
+
+
+@dataclass(frozen=True, slots=True)
 class NamedJump:
     """Placeholder for a native jump with a named target."""
 
@@ -46,7 +70,7 @@ class NamedJump:
     lineno: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LabelDecl:
     """Placeholder for a declared label like: LBL foo"""
 
@@ -54,7 +78,7 @@ class LabelDecl:
     lineno: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JumpRef:
     """Placeholder for a goto-style reference like: GO foo"""
 
@@ -62,7 +86,7 @@ class JumpRef:
     lineno: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FuncDef:
     """
     Placeholder for SUB ... SBE.
@@ -79,7 +103,7 @@ class FuncDef:
     lineno: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReturnMarker:
     """
     Placeholder for RET inside a function body.
@@ -92,7 +116,7 @@ class ReturnMarker:
     lineno: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RangeBlock:
     var: str  # loop variable (identifier)
     start: object  # token already parsed (Ident or literal)
@@ -106,9 +130,15 @@ ParsedItem = Union[
 ]
 
 
-COND_JUMP_OPS = {
-    "POP_JUMP_IF_FALSE",
-    "POP_JUMP_IF_TRUE",
-    # "JUMP_IF_FALSE_OR_POP", "JUMP_IF_TRUE_OR_POP", ...
-}
-UNCOND_JUMP_FIXED = {"JUMP_FORWARD", "JUMP_BACKWARD"}  # explicit-direction jumps
+COND_JUMP_OPS = frozenset(
+    {
+        "POP_JUMP_IF_FALSE",
+        "POP_JUMP_IF_TRUE",
+        # "JUMP_IF_FALSE_OR_POP", "JUMP_IF_TRUE_OR_POP", ...
+    }
+)
+# explicit-direction jumps
+UNCOND_JUMP_FIXED = frozenset({"JUMP_FORWARD", "JUMP_BACKWARD"})
+
+# Every jump opcode whose arg names a label; computed once for hot-loop probes
+JUMP_OPS = COND_JUMP_OPS | UNCOND_JUMP_FIXED
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from enum import IntEnum
-from typing import Any
+from enum import Enum, IntEnum
+from typing import Any, TypeVar
 
 from bytecode import BinaryOp
 from bytecode.instr import Compare
@@ -53,6 +53,24 @@ CONTAINS_SYMBOL_MAP: dict[str, str] = {
 }
 
 
+_E = TypeVar("_E", bound=Enum)
+
+
+def _text_table(enum: type[_E], symbols: dict[str, str]) -> dict[str, _E]:
+    """Exact operator text (symbol or member name) -> enum member."""
+    table = dict(enum.__members__)
+    table.update((sym, enum[name]) for sym, name in symbols.items())
+    return table
+
+
+# Built once at import: the common spellings resolve with one dict probe,
+# and anything else (other cases, ints, errors) takes the general path.
+_BINARY_TEXT = _text_table(BinaryOp, BINARY_SYMBOL_MAP)
+_COMPARE_TEXT = _text_table(Compare, COMPARE_SYMBOL_MAP)
+_IS_TEXT = _text_table(IsOp, IS_SYMBOL_MAP)
+_CONTAINS_TEXT = _text_table(ContainsOp, CONTAINS_SYMBOL_MAP)
+
+
 def coerce_binary_op(arg: Any) -> BinaryOp:
     """
     Accept BinaryOp | str(symbol|name) | int -> BinaryOp
@@ -61,6 +79,9 @@ def coerce_binary_op(arg: Any) -> BinaryOp:
         return arg
 
     if isinstance(arg, str):
+        hit = _BINARY_TEXT.get(arg)
+        if hit is not None:
+            return hit
         name = BINARY_SYMBOL_MAP.get(arg, arg).upper()
         try:
             return BinaryOp[name]  # Enum name lookup
@@ -87,6 +108,9 @@ def coerce_compare_op(arg: Any) -> Compare:
         return arg
 
     if isinstance(arg, str):
+        hit = _COMPARE_TEXT.get(arg)
+        if hit is not None:
+            return hit
         name = COMPARE_SYMBOL_MAP.get(arg, arg).upper()
         try:
             return Compare[name]
@@ -112,6 +136,9 @@ def coerce_is_op(arg: Any) -> IsOp:
         return arg
 
     if isinstance(arg, str):
+        hit = _IS_TEXT.get(arg)
+        if hit is not None:
+            return hit
         name = IS_SYMBOL_MAP.get(arg, arg).upper()
         try:
             return IsOp[name]
@@ -137,6 +164,9 @@ def coerce_contains_op(arg: Any) -> ContainsOp:
         return arg
 
     if isinstance(arg, str):
+        hit = _CONTAINS_TEXT.get(arg)
+        if hit is not None:
+            return hit
         name = CONTAINS_SYMBOL_MAP.get(arg, arg).upper()
         try:
             return ContainsOp[name]
@@ -1,7 +1,10 @@
 # paxy/parser.py
 
 import ast
+import io
+import os
 import re
+import sys
 from pathlib import Path
 from token import tok_name
 from tokenize import TokenInfo, tokenize
@@ -9,10 +12,9 @@ from typing import Any, Callable, Dict, Iterable, Iterator, Optional
 
 from bytecode import Instr
 
-from paxy.commands import command, is_command, is_command_name
+from paxy.commands import emit_command, is_command, is_command_name
 from paxy.compiler.ir import (
-    COND_JUMP_OPS,
-    UNCOND_JUMP_FIXED,
+    JUMP_OPS,
     FuncDef,
     Ident,
     NamedJump,
@@ -53,6 +55,23 @@ _ALLOWED_OPS = {
 # ----------------------------- Small helpers -----------------------------
 
 
+def _slurp(path: Path) -> bytes:
+    """Read a whole source file with a single read() sized from fstat."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) == size:
+            return data
+        # short read: drain the rest until EOF
+        parts = [data]
+        while chunk := os.read(fd, 1 << 16):
+            parts.append(chunk)
+        return b"".join(parts)
+    finally:
+        os.close(fd)
+
+
 class LineState:
     """Holds the in-progress line (opcode + args) while scanning tokens."""
 
@@ -96,8 +115,7 @@ class Emitter:
         self.sink = sink
 
     def emit_basic(self, op: str, args: list[object], lineno: int) -> None:
-        lowered = command(op, args, lineno)  # list[Instr|LabelDecl|JumpRef|...]
-        self.sink.extend(lowered)
+        emit_command(op, args, lineno, self.sink)  # Instr|LabelDecl|JumpRef|...
 
     def emit_instr(self, op: str, arg: Any, lineno: int) -> None:
         self.sink.append(Instr(op, arg, lineno=lineno))
@@ -124,7 +142,7 @@ class Emitter:
             return
 
         def _iname(x: ParsedItem) -> str:
-            return str(x.name) if isinstance(x, Instr) else ""
+            return x.name if isinstance(x, Instr) else ""
 
         if _iname(instrs[0]) != "RESUME":
             ln = getattr(instrs[0], "lineno", 1) or 1
@@ -175,9 +193,12 @@ class Parser:
     # ---- public API ----
 
     def parse_file(self, src_path: Path) -> list[ParsedItem]:
+        return self.parse_bytes(_slurp(src_path))
+
+    def parse_bytes(self, source: bytes) -> list[ParsedItem]:
+        """Parse a whole program already read into memory."""
         self._reset_state()
-        with src_path.open("rb") as f:
-            self._parse_token_iter(tokenize(f.readline))
+        self._parse_token_iter(tokenize(io.BytesIO(source).readline))
         self._flush_pending_line()  # if file lacked trailing newline
         self._emit.ensure_framing()
         return self.instructions
@@ -192,21 +213,23 @@ class Parser:
 
     # ---- stream driver ----
 
-    def process_token(self, tok_info: TokenInfo) -> None:
-        token_type_name: Optional[str] = tok_name.get(tok_info.type)
-        if token_type_name is None:
-            return
-        handler = self.handlers.get(token_type_name)
-        if handler:
-            handler(tok_info)
-
     def _parse_token_iter(
         self, tok_iter: Iterable[TokenInfo] | Iterator[TokenInfo]
     ) -> None:
         it = iter(tok_iter)
         self._tok_iter = it
+        # self.handlers re-keyed by the int token type once per parse, instead
+        # of going through tok_name per token
+        dispatch = {
+            tok_type: handler
+            for tok_type, type_name in tok_name.items()
+            if (handler := self.handlers.get(type_name)) is not None
+        }
+        get_handler = dispatch.get
         for tok_info in it:
-            self.process_token(tok_info)
+            handler = get_handler(tok_info.type)
+            if handler:
+                handler(tok_info)
 
     # ---- token handlers ----
 
@@ -445,10 +468,10 @@ class Parser:
     # ---- helpers: native emission ----
 
     def _emit_jump_or_instr(self, op: str, arg0: Any, lineno: int) -> None:
-        if op in COND_JUMP_OPS or op in UNCOND_JUMP_FIXED:
+        if op in JUMP_OPS:
             if isinstance(arg0, (Ident, str)):
                 self._emit.emit_named_jump(
-                    opcode=op, target_name=str(arg0), lineno=lineno
+                    opcode=op, target_name=sys.intern(str(arg0)), lineno=lineno
                 )
                 return
         self._emit.emit_instr(op, arg0, lineno)
@@ -1,11 +1,12 @@
 # paxy/compiler/twelve.py
-import os
 import sys
 from types import CodeType
-from typing import Union
+from typing import Optional, Union
 
 from bytecode import Bytecode, Instr, Label
 
+from paxy.compiler.flags import DEBUG
+
 CallableLoads = {"LOAD_GLOBAL", "LOAD_NAME", "LOAD_FAST", "LOAD_ATTR", "LOAD_DEREF"}
 
 
@@ -191,43 +192,87 @@ def normalize_push_null_for_calls_312_seq(
     return s
 
 
+def _drop_pop_top_after_end_for(
+    instrs: list[Union[Instr, Label]],
+) -> tuple[list[Union[Instr, Label]], int]:
+    """Return (instrs without any POP_TOP directly after END_FOR, number removed)."""
+    fixed: list[Union[Instr, Label]] = []
+    i = 0
+    removed = 0
+
+    while i < len(instrs):
+        cur = instrs[i]
+        if isinstance(cur, Instr) and cur.name == "END_FOR" and i + 1 < len(instrs):
+            nxt = instrs[i + 1]
+            if isinstance(nxt, Instr) and nxt.name == "POP_TOP":
+                fixed.append(cur)  # keep END_FOR
+                i += 2  # skip POP_TOP
+                removed += 1
+                continue
+        fixed.append(cur)
+        i += 1
+
+    return fixed, removed
+
+
+# Ops after which straight-line code is unreachable
+_TERMINATORS = frozenset({"RETURN_VALUE", "RETURN_CONST", "RAISE_VARARGS", "RERAISE"})
+
+
+def _straight_line_stacksize(bc: Bytecode) -> Optional[int]:
+    """Max stack depth of a stream with no labels or jumps, else None.
+
+    Without control flow the depth is a running sum of stack effects up to
+    the first terminator, so the control-flow-graph analysis in
+    Bytecode.to_code() is not needed.
+    """
+    depth = max_depth = 0
+    live = True
+    for ins in bc:
+        if not isinstance(ins, Instr) or ins.has_jump():
+            return None
+        if live:
+            depth += ins.stack_effect()
+            if depth < 0:
+                return None  # let bytecode report the underflow
+            max_depth = max(max_depth, depth)
+            live = ins.name not in _TERMINATORS
+    return max_depth
+
+
+def to_code(bc: Bytecode) -> CodeType:
+    """bc.to_code(), skipping the CFG pass for jump-free (straight-line) code.
+
+    Paxy never emits try blocks, so there are no exception stack depths to
+    compute either.
+    """
+    stacksize = _straight_line_stacksize(bc)
+    if stacksize is None:
+        return bc.to_code()
+    return bc.to_code(stacksize=stacksize, compute_exception_stack_depths=False)
+
+
 def try_func_to_code_with_endfor_fix(bc_func: Bytecode) -> CodeType:
     """
     Compile a function bytecode. If stacksize computation fails (3.12 edge case
     with END_FOR/POP_TOP), retry after removing POP_TOP that immediately follows END_FOR.
     """
     try:
-        return bc_func.to_code()
+        return to_code(bc_func)
     except RuntimeError as e:
         msg = str(e)
         if "stacksize" not in msg:
             raise
         # Heuristic: in some 3.12 builds, END_FOR already balances stack;
         # a trailing POP_TOP causes the negative pre-delta.
-        instrs: list[Union[Instr, Label]] = list(bc_func)
-        fixed: list[Union[Instr, Label]] = []
-        i = 0
-        removed = 0
-
-        while i < len(instrs):
-            cur = instrs[i]
-            if isinstance(cur, Instr) and cur.name == "END_FOR" and i + 1 < len(instrs):
-                nxt = instrs[i + 1]
-                if isinstance(nxt, Instr) and nxt.name == "POP_TOP":
-                    fixed.append(cur)  # keep END_FOR
-                    i += 2  # skip POP_TOP
-                    removed += 1
-                    continue
-            fixed.append(cur)
-            i += 1
-
+        fixed, removed = _drop_pop_top_after_end_for(list(bc_func))
         if removed == 0:
             # Nothing to fix; re-raise original error
             raise
 
         bc_func[:] = fixed  # mutate in place
 
-        if os.environ.get("PAXY_DEBUG"):
+        if DEBUG:
             print(
                 "== FUNC POP_TOP-FIX APPLIED == (removed",
                 removed,
@@ -242,38 +287,25 @@ def transpile_for_twelve(bc: Bytecode) -> CodeType:
     """
     Compile module bytecode. If 3.12 stacksize computation fails because an
     END_FOR is immediately followed by POP_TOP, drop that POP_TOP and retry.
+
+    The POP_TOP walk only runs on that failure, so correctly emitted code
+    never pays for it (and 3.13 skips it outright).
     """
     if sys.version_info >= (3, 13):
-        return bc.to_code()
+        return to_code(bc)
     try:
-        return bc.to_code()
+        return to_code(bc)
     except RuntimeError as e:
         if "stacksize" not in str(e):
             raise
 
-        instrs: list[Union[Instr, Label]] = list(bc)
-        fixed: list[Union[Instr, Label]] = []
-        i = 0
-        removed = 0
-
-        while i < len(instrs):
-            cur = instrs[i]
-            if isinstance(cur, Instr) and cur.name == "END_FOR" and i + 1 < len(instrs):
-                nxt = instrs[i + 1]
-                if isinstance(nxt, Instr) and nxt.name == "POP_TOP":
-                    fixed.append(cur)  # keep END_FOR
-                    i += 2  # skip POP_TOP
-                    removed += 1
-                    continue
-            fixed.append(cur)
-            i += 1
-
+        fixed, removed = _drop_pop_top_after_end_for(list(bc))
         if removed == 0:
             # Nothing to fix -> original error
             raise
 
         bc[:] = fixed
-        if os.environ.get("PAXY_DEBUG"):
+        if DEBUG:
             print("== MODULE POP_TOP-FIX APPLIED ==", "(removed", removed, "POP_TOP)")
 
         return bc.to_code()
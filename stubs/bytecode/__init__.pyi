@@ -16,6 +16,8 @@ class Instr:
     def __init__(
         self, name: str, arg: Any | None = ..., *, lineno: int | None = ...
     ) -> None: ...
+    def has_jump(self) -> bool: ...
+    def stack_effect(self, jump: Optional[bool] = ...) -> int: ...
 
 Item = Union[Instr, Label]
 
@@ -59,7 +61,14 @@ class Bytecode(MutableSequence[Item]):
     first_lineno: int
 
     def __init__(self, seq: Optional[Sequence[Item]] = ...) -> None: ...
-    def to_code(self) -> CodeType: ...
+    def to_code(
+        self,
+        compute_jumps_passes: Optional[int] = ...,
+        stacksize: Optional[int] = ...,
+        *,
+        check_pre_and_post: bool = ...,
+        compute_exception_stack_depths: bool = ...,
+    ) -> CodeType: ...
 
     # Element access
     @overload
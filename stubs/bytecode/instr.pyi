@@ -8,3 +8,16 @@ class Compare(Enum):
     LE: "Compare"
     GT: "Compare"
     GE: "Compare"
+
+class _UNSET: ...
+
+UNSET: _UNSET
+
+class InstrLocation:
+    def __init__(
+        self,
+        lineno: int | None,
+        end_lineno: int | None,
+        col_offset: int | None,
+        end_col_offset: int | None,
+    ) -> None: ...
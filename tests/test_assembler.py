@@ -58,3 +58,29 @@ def test_compile_file_writes_pyc_and_is_importable(
 
     assert printed == ["hello"]
     assert mod is not None
+
+
+def test_assembler_tracks_first_lineno():
+    from paxy.compiler.assembler import Assembler
+    from paxy.compiler.parser import Parser
+
+    asm = Assembler(Parser().parse_bytes(b"# comment\n\nPNT 'hello'\n"))
+    asm.resolve()
+    assert asm.first_lineno == 3
+
+
+def test_straight_line_to_code_matches_bytecode():
+    from bytecode import Bytecode
+
+    from paxy.compiler.assembler import Assembler
+    from paxy.compiler.parser import Parser
+    from paxy.compiler.twelve import _straight_line_stacksize, to_code
+
+    src = b"LET a 1\nLET b 2\nGOS c max a b\nPNT c\n"
+    resolved = Assembler(Parser().parse_bytes(src)).resolve()
+    assert _straight_line_stacksize(Bytecode(resolved)) is not None
+
+    fast = to_code(Bytecode(resolved))
+    ref = Bytecode(resolved).to_code()
+    assert fast.co_code == ref.co_code
+    assert fast.co_stacksize == ref.co_stacksize
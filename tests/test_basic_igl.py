@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Any, Iterable, List, Tuple, TypeAlias
 import pytest
+from bytecode import BinaryOp
 from paxy.compiler.parser import Parser
 
 # 3.14: RETURN_VALUE carries bytecode.instr._UNSET() when there's no explicit value
@@ -44,7 +45,8 @@ def test_igl_literals_fast_path(tmp_path: Path) -> None:
 
 
 def test_igl_with_identifiers_falls_back_to_call(tmp_path: Path) -> None:
-    # Fallback path: identifiers present → LOAD_NAME 'frozenset'; LOAD_*…; BUILD_TUPLE; CALL 1
+    # Fallback path: identifiers present → literals folded into one frozenset
+    # constant, unioned with a BUILD_SET of the names (no call, no temp)
     src = tmp_path / "igl_mixed.paxy"
     src.write_text("LET a 10\n" "LET b 20\n" "IGL s a 'x' b\n")
     got = as_pairs(Parser().parse_file(src))
@@ -56,13 +58,12 @@ def test_igl_with_identifiers_falls_back_to_call(tmp_path: Path) -> None:
         # LET b 20
         ("LOAD_CONST", 20),
         ("STORE_NAME", "b"),
-        # IGL s a 'x' b  → fallback via function call
-        ("LOAD_NAME", "frozenset"),
+        # IGL s a 'x' b  → frozenset({'x'}) | {a, b}
+        ("LOAD_CONST", frozenset({"x"})),
         ("LOAD_NAME", "a"),
-        ("LOAD_CONST", "x"),
         ("LOAD_NAME", "b"),
-        ("BUILD_TUPLE", 3),
-        ("CALL", 1),
+        ("BUILD_SET", 2),
+        ("BINARY_OP", BinaryOp.OR),
         ("STORE_NAME", "s"),
         ("LOAD_CONST", 0),
         ("RETURN_VALUE", UNSET),
@@ -82,3 +83,24 @@ def test_igl_errors(tmp_path: Path, program: str, msg_part: str) -> None:
     with pytest.raises(SyntaxError) as exc:
         Parser().parse_file(src)
     assert msg_part in str(exc.value)
+
+
+def test_igl_with_identifiers_runs(tmp_path: Path) -> None:
+    from paxy.compiler.compile import PaxyCompiler
+
+    src = tmp_path / "igl_run.paxy"
+    src.write_text("LET a 10\n" "IGL s a 'x' 3\n" "IGL t a\n")
+    g: dict[str, object] = {}
+    PaxyCompiler(src, no_cache=True).run(g)
+    assert g["s"] == frozenset({10, "x", 3})
+    assert g["t"] == frozenset({10})
+
+
+def test_igl_with_identifiers_runs_inside_sub(tmp_path: Path) -> None:
+    from paxy.compiler.compile import PaxyCompiler
+
+    src = tmp_path / "igl_sub.paxy"
+    src.write_text("SUB f a\n" "  IGL s a 1 2\n" "  RET s\n" "SBE\n" "GOS r f 9\n")
+    g: dict[str, object] = {}
+    PaxyCompiler(src, no_cache=True).run(g)
+    assert g["r"] == frozenset({9, 1, 2})
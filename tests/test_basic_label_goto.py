@@ -57,3 +57,10 @@ def test_label_errors(tmp_path: Path):
     src.write_text("GO nowhere\n")
     with pytest.raises(SyntaxError):
         assemble_file(src)
+
+
+def test_label_conditional_jump_to_undefined(tmp_path: Path):
+    src = tmp_path / "undef_if.paxy"
+    src.write_text("LET a 1\nIF a == 1 nowhere\nLBL somewhere\n")
+    with pytest.raises(SyntaxError, match="undefined LBL 'nowhere'"):
+        assemble_file(src, no_cache=True)
@@ -216,3 +216,16 @@ def test_let_membership_in(tmp_path: Path) -> None:
         ("LOAD_CONST", 0),
         ("RETURN_VALUE", UNSET),
     ]
+
+
+def test_let_op_table_matches_coercion_chain() -> None:
+    from paxy.commands.core.let import _OP_TABLE, Let, _classify_op_text
+    from paxy.compiler.ir import Ident
+
+    for text, hit in _OP_TABLE.items():
+        assert hit == _classify_op_text(text)
+    # names outside the table (e.g. lower-case) still classify
+    assert _classify_op_text("eq") == _OP_TABLE["=="]
+    for text in ("eq", "Is_Not", "not_in", "add"):
+        let = Let([Ident("x"), 1], 1)
+        assert let._classify_and_coerce_op(text) == _classify_op_text(text)
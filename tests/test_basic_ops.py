@@ -109,3 +109,60 @@ def test_print_no_arg_blank_line(tmp_path: Path):
         ("LOAD_CONST", None),
         ("RETURN_VALUE", "<ARGLESS>"),
     ]
+
+
+def test_core_command_table_matches_lazy_paths():
+    from paxy.commands.core import CORE_COMMAND_PATHS, CORE_COMMANDS, load_command
+
+    assert set(CORE_COMMANDS) == set(CORE_COMMAND_PATHS)
+    for name, cls in CORE_COMMANDS.items():
+        assert cls is load_command(name)
+        assert cls.COMMAND == name
+
+
+def test_fast_instr_matches_validated_instr():
+    from bytecode import Instr
+    from bytecode.instr import UNSET
+
+    from paxy.compiler.fastinstr import _fast_instr
+
+    for name, arg in [
+        ("LOAD_NAME", "print"),
+        ("LOAD_CONST", 42),
+        ("CALL", 1),
+        ("POP_TOP", UNSET),
+        ("POP_JUMP_IF_FALSE", bytecode.Label()),
+    ]:
+        fast = _fast_instr(name, arg, lineno=7)
+        slow = Instr(name, arg, lineno=7)
+        assert fast == slow
+        assert fast.lineno == 7
+        assert fast.has_jump() == slow.has_jump()
+
+
+def test_emit_command_appends_to_sink():
+    from paxy.commands import command, emit_command
+
+    sink = [bytecode.Instr("NOP", lineno=1)]
+    emit_command("PNT", [42], 3, sink)
+    assert as_pairs(sink[1:]) == as_pairs(command("PNT", [42], 3))
+    assert sink[0].name == "NOP"
+
+
+def test_fast_instrs_share_location_but_not_lineno_updates():
+    from paxy.compiler.fastinstr import _fast_instr
+
+    a = _fast_instr("PUSH_NULL", lineno=5)
+    b = _fast_instr("POP_TOP", lineno=5)
+    assert a.location is b.location
+    a.lineno = 9
+    assert (a.lineno, b.lineno) == (9, 5)
+
+
+def test_plain_name_is_one_interned_str_per_spelling():
+    from paxy.compiler.ir import Ident, plain_name
+
+    name = plain_name(Ident("counter"))
+    assert type(name) is str and name == "counter"
+    assert plain_name(Ident("counter")) is name
+    assert plain_name("counter") is name
@@ -81,3 +81,30 @@ def test_end_to_end_range_inside_sub(tmp_path: Path):
 
     # sum_to(5) with range(1,5): 1+2+3+4 = 10
     assert g.get("total") == 10
+
+
+def test_unresolved_jump_in_range_body_errors_under_O():
+    # RNG bodies are copied into the stream as-is, so a native jump that still
+    # carries a name must be reported by the lowering check, even with -O.
+    # _fast_instr skips Instr's validation, so it works under PAXY_DEBUG too.
+    import subprocess
+    import sys
+
+    code = (
+        "from paxy.compiler.assembler import Assembler\n"
+        "from paxy.compiler.fastinstr import _fast_instr\n"
+        "from paxy.compiler.ir import RangeBlock\n"
+        "body = [_fast_instr('POP_JUMP_IF_TRUE', 'done', lineno=2)]\n"
+        "try:\n"
+        "    Assembler([RangeBlock('i', 1, 3, body, 1)]).resolve()\n"
+        "except RuntimeError as e:\n"
+        "    print(e)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-O", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    ).stdout
+    assert "jump still has non-Label arg" in out
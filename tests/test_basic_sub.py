@@ -1,15 +1,15 @@
 # tests/test_basic_sub.py
+import dis
+import types
 from pathlib import Path
 from types import CodeType
-import types
 
-
-from bytecode import Instr
 import pytest
+from bytecode import Instr
 
-from paxy.compiler.parser import Parser
-from paxy.compiler.ir import FuncDef, ReturnMarker
 from paxy.compiler.assembler import Assembler
+from paxy.compiler.ir import FuncDef, ReturnMarker
+from paxy.compiler.parser import Parser
 from tests.helpers import assemble_file
 
 
@@ -97,3 +97,21 @@ def test_end_to_end_sub_and_gosub(tmp_path: Path, capsys: pytest.CaptureFixture[
     assert g.get("z") == 42
     # (Optional) your PNT macro currently LOAD_CONSTs the arg if it's an Ident,
     # so stdout may print "z" literally; don't assert on stdout unless you adjust PNT.
+
+
+def test_funcdef_body_is_lowered_once(tmp_path: Path):
+    src = tmp_path / "sub3.paxy"
+    src.write_text("SUB once\n" "  LOAD_CONST 123\n" "  RET\n" "SBE\n")
+
+    resolved = Assembler(Parser().parse_file(src)).resolve()
+    code_const = next(
+        it.arg for it in resolved if isinstance(it, Instr) and it.name == "LOAD_CONST"
+    )
+
+    # The body must appear exactly once in the function's code
+    body_loads = [
+        ins
+        for ins in dis.get_instructions(code_const)
+        if ins.opname == "LOAD_CONST" and ins.argval == 123
+    ]
+    assert len(body_loads) == 1
@@ -122,3 +122,19 @@ def test_missing_source_exits(monkeypatch, tmp_path: Path):
 
     with pytest.raises(FileNotFoundError):
         cli.main()
+
+
+def test_several_sources_need_compile_only(monkeypatch, tmp_path: Path):
+    a, b = tmp_path / "a.paxy", tmp_path / "b.paxy"
+    a.write_text("")
+    b.write_text("")
+
+    monkeypatch.setattr(sys, "argv", ["paxy", str(a), str(b)])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+    seen: list[list[Path]] = []
+    monkeypatch.setattr(cli, "compile_files", lambda srcs, **kw: seen.append(srcs))
+    monkeypatch.setattr(sys, "argv", ["paxy", "--compile-only", str(a), str(b)])
+    cli.main()
+    assert seen == [[str(a), str(b)]]
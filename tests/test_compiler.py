@@ -64,3 +64,120 @@ def test_with_py_exists_writes_cpython_cache_path(monkeypatch, tmp_path):
     sys.modules.pop("hello", None)
     spec = importlib.util.find_spec("hello")
     assert spec is not None, "import system did not find hello module (via source)"
+
+
+def test_cache_hit_skips_parsing(monkeypatch, tmp_path):
+    src = tmp_path / "hello.paxy"
+    src.write_text("LOAD_CONST 1\nSTORE_NAME x\n")
+
+    first = compiler.PaxyCompiler(src).assemble()
+
+    def _no_parse(self, source):
+        raise AssertionError("cache hit must not re-parse the source")
+
+    monkeypatch.setattr("paxy.compiler.parser.Parser.parse_bytes", _no_parse)
+    cached = compiler.PaxyCompiler(src).assemble()
+    assert cached.co_code == first.co_code
+
+
+def test_env_no_cache_skips_pyc(monkeypatch, tmp_path):
+    src = tmp_path / "hello.paxy"
+    src.write_text("LOAD_CONST 1\nSTORE_NAME x\n")
+    monkeypatch.setenv("PAXY_NO_CACHE", "1")
+
+    c = compiler.PaxyCompiler(src)
+    c.assemble()
+    assert not c.pyc_path().exists()
+
+
+def test_compile_files_batch_matches_single(tmp_path):
+    from paxy.compiler.compile import PaxyCompiler, compile_files
+
+    srcs = []
+    for i in range(3):
+        src = tmp_path / f"prog{i}.paxy"
+        src.write_text(f"LET x {i}\n")
+        srcs.append(src)
+
+    outs = compile_files(srcs, max_workers=2)
+    assert outs == [PaxyCompiler(s).pyc_path() for s in srcs]
+    for i, (src, out) in enumerate(zip(srcs, outs)):
+        assert out.exists()
+        g: dict[str, object] = {}
+        exec(PaxyCompiler(src).assemble(), g)  # served from the new pyc
+        assert g["x"] == i
+
+
+def test_compile_pyc_writes_once_on_cache_miss(monkeypatch, tmp_path):
+    src = tmp_path / "hello.paxy"
+    src.write_text("LET x 1\n")
+
+    c = compiler.PaxyCompiler(src)
+    writes = []
+    real_write = c._write_cache
+    monkeypatch.setattr(
+        c, "_write_cache", lambda *a, **kw: writes.append(1) or real_write(*a, **kw)
+    )
+    out = c.compile_pyc()
+    assert out.exists() and len(writes) == 1
+
+
+def test_compile_pyc_skips_rewrite_on_hash_hit(monkeypatch, tmp_path):
+    src = tmp_path / "hello.paxy"
+    src.write_text("LET x 1\n")
+    compiler.PaxyCompiler(src).assemble()  # leaves a hash-based pyc
+
+    def _no_write(*args, **kwargs):
+        raise AssertionError("a current hash-based pyc must not be rewritten")
+
+    c = compiler.PaxyCompiler(src)
+    monkeypatch.setattr(c, "_write_cache", _no_write)
+    assert c.compile_pyc().exists()
+
+
+def test_load_from_cache_checks_header_before_code(tmp_path):
+    src = tmp_path / "hello.paxy"
+    src.write_text("LET x 1\n")
+    c = compiler.PaxyCompiler(src)
+
+    # timestamp-based pyc validates against the source stat
+    c.compile_pyc(hash_based=False)
+    g: dict[str, object] = {}
+    exec(c._load_from_cache(), g)
+    assert g["x"] == 1
+
+    # hash-based pyc for other source bytes is stale: rejected from its header
+    src.write_text("LET x 2\n")
+    c = compiler.PaxyCompiler(src)
+    c._write_cache(compile("x = 1\n", str(src), "exec"), src_hash=b"\0" * 8)
+    assert c._load_from_cache() is None
+
+    # wrong MAGIC (other interpreter) is rejected too
+    pyc = c.pyc_path()
+    pyc.write_bytes(b"\0\0\0\0" + pyc.read_bytes()[4:])
+    assert c._load_from_cache() is None
+
+
+def test_compile_files_caps_workers_at_file_count(monkeypatch, tmp_path):
+    import paxy.compiler.compile as compile_mod
+
+    srcs = []
+    for i in range(2):
+        src = tmp_path / f"prog{i}.paxy"
+        src.write_text(f"LET x {i}\n")
+        srcs.append(src)
+
+    sizes = []
+    real_pool = compile_mod.ProcessPoolExecutor
+
+    def _pool(max_workers):
+        sizes.append(max_workers)
+        return real_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(compile_mod, "ProcessPoolExecutor", _pool)
+    compile_mod.compile_files(srcs, max_workers=64)
+    assert sizes == [2]
+
+    # one worker compiles in-process, without starting a pool
+    compile_mod.compile_files(srcs, max_workers=1)
+    assert sizes == [2]
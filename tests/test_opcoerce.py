@@ -150,3 +150,16 @@ def test_compare_membership_and_identity_symbols():
     # identity
     assert coerce_is_op("is") is IsOp.IS
     assert coerce_is_op("is not") is IsOp.IS_NOT
+
+
+def test_text_tables_match_general_path():
+    from paxy.compiler import opcoerce as oc
+
+    for table, enum, symbols in [
+        (oc._BINARY_TEXT, BinaryOp, oc.BINARY_SYMBOL_MAP),
+        (oc._COMPARE_TEXT, Compare, oc.COMPARE_SYMBOL_MAP),
+        (oc._IS_TEXT, IsOp, oc.IS_SYMBOL_MAP),
+        (oc._CONTAINS_TEXT, ContainsOp, oc.CONTAINS_SYMBOL_MAP),
+    ]:
+        for text, member in table.items():
+            assert member is enum[symbols.get(text, text).upper()]
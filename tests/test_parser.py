@@ -75,3 +75,9 @@ def test_parser_handles_no_trailing_newline(tmp_path: Path):
     instrs = p.parse_file(src)
 
     assert_prog(instrs)
+
+
+def test_parser_parse_bytes_matches_parse_file():
+    instrs = Parser().parse_bytes(PROGRAM.encode("utf-8"))
+
+    assert_prog(instrs)